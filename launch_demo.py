@@ -20,12 +20,36 @@ Features:
 import os
 import sys
 import asyncio
+import logging
 import time
+from itertools import islice
 from pathlib import Path
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+logger = logging.getLogger("launch_demo")
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+try:
+    from agentic_worm.core.state import create_initial_state
+    from agentic_worm.core.system import create_demo_system
+    from agentic_worm.intelligence.workflow import AgenticWorkflow
+    from agentic_worm.intelligence.openworm import get_openworm_client, initialize_openworm
+    IMPORT_ERROR = None
+except ImportError as e:
+    IMPORT_ERROR = e
+    create_initial_state = None
+    create_demo_system = None
+    AgenticWorkflow = None
+    get_openworm_client = None
+    initialize_openworm = None
+
 # Beautiful console output
 class Colors:
     BLUE = '\033[34m'
@@ -38,6 +62,11 @@ class Colors:
     UNDERLINE = '\033[4m'
     NC = '\033[0m'
 
+# Skip ANSI escapes entirely when output is piped or captured
+if not sys.stdout.isatty():
+    for _attr in [a for a in vars(Colors) if not a.startswith('_')]:
+        setattr(Colors, _attr, '')
+
 def print_title():
     """Print the main title screen."""
     title = f"""
@@ -53,102 +82,117 @@ def print_title():
 """
     print(title)
 
+# Demo scenarios shown in the launcher menu
+SCENARIOS = [
+    {
+        "id": "1",
+        "name": "🍔 Food Seeking Behavior",
+        "description": "Watch the worm hunt for food using chemotaxis and memory",
+        "features": ["Goal-directed behavior", "Sensory processing", "Memory formation"],
+        "duration": "3 minutes",
+        "complexity": "Beginner"
+    },
+    {
+        "id": "2", 
+        "name": "🗺️ Exploration & Mapping",
+        "description": "Autonomous environment exploration with spatial cognition",
+        "features": ["Curiosity-driven behavior", "Spatial mapping", "Adaptive planning"],
+        "duration": "5 minutes",
+        "complexity": "Intermediate"
+    },
+    {
+        "id": "3",
+        "name": "🚧 Obstacle Navigation",
+        "description": "Complex maze solving with learning and adaptation",
+        "features": ["Problem solving", "Path optimization", "Dynamic learning"],
+        "duration": "7 minutes", 
+        "complexity": "Advanced"
+    },
+    {
+        "id": "4",
+        "name": "🧠 Neural Activity Showcase",
+        "description": "Real-time 302-neuron C. elegans brain simulation",
+        "features": ["OpenWorm integration", "Neural visualization", "Connectome analysis"],
+        "duration": "4 minutes",
+        "complexity": "Expert"
+    },
+    {
+        "id": "5",
+        "name": "🌐 Live Dashboard Demo", 
+        "description": "Interactive web dashboard with real-time AI monitoring",
+        "features": ["Web interface", "Real-time charts", "Interactive controls"],
+        "duration": "10 minutes",
+        "complexity": "Showcase"
+    },
+    {
+        "id": "6",
+        "name": "🔬 OpenWorm Integration Test",
+        "description": "Test real C. elegans neural connectivity and fallback systems",
+        "features": ["Real biological data", "API connectivity", "Fallback simulation"],
+        "duration": "2 minutes",
+        "complexity": "Technical"
+    },
+    {
+        "id": "7",
+        "name": "🎯 Custom Behavior Designer",
+        "description": "Create your own worm behavior with custom goals",
+        "features": ["Interactive configuration", "Goal customization", "Parameter tuning"],
+        "duration": "Variable",
+        "complexity": "Creative"
+    },
+    {
+        "id": "8",
+        "name": "📊 Performance Benchmark",
+        "description": "Stress test the AI system with rapid decision cycles",
+        "features": ["Performance metrics", "Speed testing", "System analysis"],
+        "duration": "1 minute",
+        "complexity": "Technical"
+    }
+]
+
+COMPLEXITY_COLORS = {
+    "Beginner": Colors.GREEN,
+    "Intermediate": Colors.CYAN,
+    "Advanced": Colors.YELLOW,
+    "Expert": Colors.MAGENTA,
+    "Showcase": Colors.BOLD + Colors.BLUE,
+    "Technical": Colors.RED,
+    "Creative": Colors.BOLD + Colors.GREEN
+}
+
+def render_scenarios():
+    """Render the scenario menu as a single string."""
+    buf = []
+    for scenario in SCENARIOS:
+        complexity_color = COMPLEXITY_COLORS.get(scenario["complexity"], Colors.NC)
+        
+        buf.append(
+            f"{Colors.BOLD}[{scenario['id']}]{Colors.NC} {scenario['name']}\n"
+            f"    {Colors.CYAN}{scenario['description']}{Colors.NC}\n"
+            f"    {Colors.GREEN}Features:{Colors.NC} {', '.join(scenario['features'])}\n"
+            f"    {Colors.YELLOW}Duration:{Colors.NC} {scenario['duration']} | "
+            f"{complexity_color}Complexity:{Colors.NC} {scenario['complexity']}\n\n"
+        )
+    
+    buf.append(f"{Colors.BOLD}[0]{Colors.NC} {Colors.RED}Exit{Colors.NC}\n\n")
+    return "".join(buf)
+
+# The menu never changes, so render it once at import
+_RENDERED_MENU = render_scenarios()
+
 def print_scenarios():
     """Print available demo scenarios."""
-    scenarios = [
-        {
-            "id": "1",
-            "name": "🍔 Food Seeking Behavior",
-            "description": "Watch the worm hunt for food using chemotaxis and memory",
-            "features": ["Goal-directed behavior", "Sensory processing", "Memory formation"],
-            "duration": "3 minutes",
-            "complexity": "Beginner"
-        },
-        {
-            "id": "2", 
-            "name": "🗺️ Exploration & Mapping",
-            "description": "Autonomous environment exploration with spatial cognition",
-            "features": ["Curiosity-driven behavior", "Spatial mapping", "Adaptive planning"],
-            "duration": "5 minutes",
-            "complexity": "Intermediate"
-        },
-        {
-            "id": "3",
-            "name": "🚧 Obstacle Navigation",
-            "description": "Complex maze solving with learning and adaptation",
-            "features": ["Problem solving", "Path optimization", "Dynamic learning"],
-            "duration": "7 minutes", 
-            "complexity": "Advanced"
-        },
-        {
-            "id": "4",
-            "name": "🧠 Neural Activity Showcase",
-            "description": "Real-time 302-neuron C. elegans brain simulation",
-            "features": ["OpenWorm integration", "Neural visualization", "Connectome analysis"],
-            "duration": "4 minutes",
-            "complexity": "Expert"
-        },
-        {
-            "id": "5",
-            "name": "🌐 Live Dashboard Demo", 
-            "description": "Interactive web dashboard with real-time AI monitoring",
-            "features": ["Web interface", "Real-time charts", "Interactive controls"],
-            "duration": "10 minutes",
-            "complexity": "Showcase"
-        },
-        {
-            "id": "6",
-            "name": "🔬 OpenWorm Integration Test",
-            "description": "Test real C. elegans neural connectivity and fallback systems",
-            "features": ["Real biological data", "API connectivity", "Fallback simulation"],
-            "duration": "2 minutes",
-            "complexity": "Technical"
-        },
-        {
-            "id": "7",
-            "name": "🎯 Custom Behavior Designer",
-            "description": "Create your own worm behavior with custom goals",
-            "features": ["Interactive configuration", "Goal customization", "Parameter tuning"],
-            "duration": "Variable",
-            "complexity": "Creative"
-        },
-        {
-            "id": "8",
-            "name": "📊 Performance Benchmark",
-            "description": "Stress test the AI system with rapid decision cycles",
-            "features": ["Performance metrics", "Speed testing", "System analysis"],
-            "duration": "1 minute",
-            "complexity": "Technical"
-        }
-    ]
-    
-    for scenario in scenarios:
-        complexity_color = {
-            "Beginner": Colors.GREEN,
-            "Intermediate": Colors.CYAN,
-            "Advanced": Colors.YELLOW,
-            "Expert": Colors.MAGENTA,
-            "Showcase": Colors.BOLD + Colors.BLUE,
-            "Technical": Colors.RED,
-            "Creative": Colors.BOLD + Colors.GREEN
-        }.get(scenario["complexity"], Colors.NC)
-        
-        print(f"{Colors.BOLD}[{scenario['id']}]{Colors.NC} {scenario['name']}")
-        print(f"    {Colors.CYAN}{scenario['description']}{Colors.NC}")
-        print(f"    {Colors.GREEN}Features:{Colors.NC} {', '.join(scenario['features'])}")
-        print(f"    {Colors.YELLOW}Duration:{Colors.NC} {scenario['duration']} | "
-              f"{complexity_color}Complexity:{Colors.NC} {scenario['complexity']}")
-        print()
-    
-    print(f"{Colors.BOLD}[0]{Colors.NC} {Colors.RED}Exit{Colors.NC}")
-    print()
+    sys.stdout.write(_RENDERED_MENU)
+    sys.stdout.flush()
+
+VALID_CHOICES = frozenset("012345678")
 
 def get_user_choice():
     """Get user's scenario choice."""
     while True:
         try:
             choice = input(f"{Colors.YELLOW}Enter your choice (0-8): {Colors.NC}").strip()
-            if choice in ['0', '1', '2', '3', '4', '5', '6', '7', '8']:
+            if choice in VALID_CHOICES:
                 return choice
             else:
                 print(f"{Colors.RED}Invalid choice. Please enter 0-8.{Colors.NC}")
@@ -156,17 +200,34 @@ def get_user_choice():
             print(f"\n{Colors.YELLOW}Goodbye!{Colors.NC}")
             sys.exit(0)
 
+async def sleep_until(deadline: float):
+    """Sleep until ``deadline`` on the loop clock; return immediately if already late."""
+    delay = deadline - asyncio.get_running_loop().time()
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+# Initialized workflows reused across demos, keyed by enable_learning
+_workflow_cache = {}
+
+async def get_workflow(enable_learning: bool = True):
+    """Get an initialized AgenticWorkflow, creating it on first use."""
+    workflow = _workflow_cache.get(enable_learning)
+    if workflow is None:
+        workflow = AgenticWorkflow(enable_learning=enable_learning)
+        await workflow.initialize()
+        _workflow_cache[enable_learning] = workflow
+    else:
+        # Each demo reports its own decision and success counts
+        workflow.reset_metrics()
+    return workflow
+
 async def run_food_seeking_demo():
     """Run the food seeking behavior demo."""
     print(f"\n{Colors.GREEN}🍔 Starting Food Seeking Behavior Demo...{Colors.NC}")
     
     try:
-        from agentic_worm.core.state import create_initial_state
-        from agentic_worm.intelligence.workflow import AgenticWorkflow
-        
-        # Initialize workflow
-        workflow = AgenticWorkflow(enable_learning=True)
-        await workflow.initialize()
+        # Reuse the shared workflow
+        workflow = await get_workflow(enable_learning=True)
         
         # Create state with food-seeking goal
         state = create_initial_state("food_seeking_demo")
@@ -178,32 +239,33 @@ async def run_food_seeking_demo():
         # Run for 3 minutes
         duration = 180
         steps = 200
+        dt = duration / steps
+        deadline = asyncio.get_running_loop().time()
+        next_log = 0
         
         for i in range(steps):
             state = await workflow.process_step(state)
             
-            if i % 20 == 0:
+            if i == next_log:
+                next_log += 20
                 fitness = state.get("fitness_score", 0)
                 decision = state.get("decision_context", {}).get("current_decision", "none")
                 print(f"📊 Step {i}: Decision={decision} | Fitness={fitness:.3f}")
             
-            await asyncio.sleep(duration / steps)
+            deadline += dt
+            await sleep_until(deadline)
         
         print(f"\n{Colors.GREEN}✅ Food seeking demo completed!{Colors.NC}")
         
-    except Exception as e:
-        print(f"{Colors.RED}❌ Demo failed: {e}{Colors.NC}")
+    except Exception:
+        logger.exception("Demo failed")
 
 async def run_exploration_demo():
     """Run the exploration and mapping demo."""
     print(f"\n{Colors.GREEN}🗺️ Starting Exploration & Mapping Demo...{Colors.NC}")
     
     try:
-        from agentic_worm.core.state import create_initial_state
-        from agentic_worm.intelligence.workflow import AgenticWorkflow
-        
-        workflow = AgenticWorkflow(enable_learning=True)
-        await workflow.initialize()
+        workflow = await get_workflow(enable_learning=True)
         
         state = create_initial_state("exploration_demo")
         state["decision_context"]["current_goal"] = "explore"
@@ -216,37 +278,44 @@ async def run_exploration_demo():
         steps = 250
         
         exploration_areas = ["north_quadrant", "east_region", "south_boundary", "west_territory", "central_hub"]
+        dt = duration / steps
+        deadline = asyncio.get_running_loop().time()
+        next_target = 50
+        next_log = 0
+        
+        current_target = "initial_area"
+        target_index = 0
         
         for i in range(steps):
-                                      # Change exploration target periodically
-             if i % 50 == 0 and i > 0:
-                 area = exploration_areas[i // 50 % len(exploration_areas)]
-                 print(f"{Colors.MAGENTA}🗺️ New exploration target: {area}{Colors.NC}")
-             
-             state = await workflow.process_step(state)
-             
-             if i % 25 == 0:
-                 fitness = state.get("fitness_score", 0)
-                 decision = state.get("decision_context", {}).get("current_decision", "none")
-                 current_target = exploration_areas[i // 50 % len(exploration_areas)] if i >= 50 else "initial_area"
-                 print(f"📊 Step {i}: Decision={decision} | Target={current_target} | Fitness={fitness:.3f}")
-             await asyncio.sleep(duration / steps)
+            # Change exploration target periodically
+            if i == next_target:
+                next_target += 50
+                current_target = exploration_areas[target_index]
+                target_index = (target_index + 1) % len(exploration_areas)
+                print(f"{Colors.MAGENTA}🗺️ New exploration target: {current_target}{Colors.NC}")
+            
+            state = await workflow.process_step(state)
+            
+            if i == next_log:
+                next_log += 25
+                fitness = state.get("fitness_score", 0)
+                decision = state.get("decision_context", {}).get("current_decision", "none")
+                print(f"📊 Step {i}: Decision={decision} | Target={current_target} | Fitness={fitness:.3f}")
+            
+            deadline += dt
+            await sleep_until(deadline)
         
         print(f"\n{Colors.GREEN}✅ Exploration demo completed!{Colors.NC}")
         
-    except Exception as e:
-        print(f"{Colors.RED}❌ Demo failed: {e}{Colors.NC}")
+    except Exception:
+        logger.exception("Demo failed")
 
 async def run_obstacle_navigation_demo():
     """Run the obstacle navigation demo."""
     print(f"\n{Colors.GREEN}🚧 Starting Obstacle Navigation Demo...{Colors.NC}")
     
     try:
-        from agentic_worm.core.state import create_initial_state
-        from agentic_worm.intelligence.workflow import AgenticWorkflow
-        
-        workflow = AgenticWorkflow(enable_learning=True)
-        await workflow.initialize()
+        workflow = await get_workflow(enable_learning=True)
         
         state = create_initial_state("navigation_demo")
         state["decision_context"]["current_goal"] = "navigate_maze"
@@ -259,37 +328,44 @@ async def run_obstacle_navigation_demo():
         
         duration = 420  # 7 minutes
         steps = 300
+        dt = duration / steps
+        deadline = asyncio.get_running_loop().time()
+        
+        # process_step updates the state in place, so this reference stays valid
+        env = state.setdefault("environment", {})
+        next_obstacle = 60
+        next_log = 0
         
         for i in range(steps):
             # Introduce obstacles periodically
-            if i % 60 == 0 and i > 0:
+            if i == next_obstacle:
+                next_obstacle += 60
                 obstacle = obstacles[i // 60 % len(obstacles)]
-                state["environment"] = state.get("environment", {})
-                state["environment"]["current_obstacle"] = obstacle
+                env["current_obstacle"] = obstacle
                 print(f"{Colors.RED}🚧 Obstacle encountered: {obstacle}{Colors.NC}")
             
             state = await workflow.process_step(state)
             
-            if i % 30 == 0:
+            if i == next_log:
+                next_log += 30
                 fitness = state.get("fitness_score", 0)
-                decision = state.get("decision_context", {}).get("current_decision", "none")
-                obstacle = state.get("environment", {}).get("current_obstacle", "none")
+                decision = state["decision_context"].get("current_decision", "none")
+                obstacle = env.get("current_obstacle", "none")
                 print(f"📊 Step {i}: Decision={decision} | Obstacle={obstacle} | Fitness={fitness:.3f}")
             
-            await asyncio.sleep(duration / steps)
+            deadline += dt
+            await sleep_until(deadline)
         
         print(f"\n{Colors.GREEN}✅ Obstacle navigation demo completed!{Colors.NC}")
         
-    except Exception as e:
-        print(f"{Colors.RED}❌ Demo failed: {e}{Colors.NC}")
+    except Exception:
+        logger.exception("Demo failed")
 
 async def run_neural_showcase_demo():
     """Run the neural activity showcase demo."""
     print(f"\n{Colors.GREEN}🧠 Starting Neural Activity Showcase Demo...{Colors.NC}")
     
     try:
-        from agentic_worm.intelligence.openworm import get_openworm_client, initialize_openworm
-        
         print(f"{Colors.BLUE}🔗 Initializing OpenWorm connection...{Colors.NC}")
         
         # Try to connect to real OpenWorm
@@ -308,34 +384,44 @@ async def run_neural_showcase_demo():
         # Run neural showcase for 4 minutes
         duration = 240
         steps = 120
+        dt = duration / steps
+        deadline = asyncio.get_running_loop().time()
+        next_log = 0
         
         for i in range(steps):
             # Get neural state
             neural_state = await client.get_neural_state()
             
-            if i % 10 == 0:
+            if i == next_log:
+                next_log += 10
                 neuron_count = len(neural_state.get("neurons", {}))
                 global_activity = neural_state.get("global_activity", 0)
                 simulation_step = neural_state.get("simulation_step", 0)
                 
-                print(f"🧠 Neural State {i}: Neurons={neuron_count} | "
-                      f"Activity={global_activity:.2f}Hz | Step={simulation_step}")
+                lines = [
+                    f"🧠 Neural State {i}: Neurons={neuron_count} | "
+                    f"Activity={global_activity:.2f}Hz | Step={simulation_step}\n"
+                ]
                 
                 # Show sample neuron activity
                 neurons = neural_state.get("neurons", {})
                 if neurons:
-                    sample_neurons = list(neurons.items())[:3]
+                    sample_neurons = islice(neurons.items(), 3)
                     for neuron_id, data in sample_neurons:
                         membrane = data.get("membrane_potential", 0)
                         firing = data.get("firing_rate", 0)
-                        print(f"  🔬 {neuron_id}: {membrane:.1f}mV, {firing:.1f}Hz")
+                        lines.append(f"  🔬 {neuron_id}: {membrane:.1f}mV, {firing:.1f}Hz\n")
+                
+                sys.stdout.write("".join(lines))
+                sys.stdout.flush()
             
-            await asyncio.sleep(duration / steps)
+            deadline += dt
+            await sleep_until(deadline)
         
         print(f"\n{Colors.GREEN}✅ Neural showcase demo completed!{Colors.NC}")
         
-    except Exception as e:
-        print(f"{Colors.RED}❌ Demo failed: {e}{Colors.NC}")
+    except Exception:
+        logger.exception("Demo failed")
 
 async def test_arangodb_connection():
     """Test ArangoDB connection before starting the system."""
@@ -384,6 +470,31 @@ async def test_arangodb_connection():
         print(f"{Colors.YELLOW}💡 Make sure ArangoDB is running and accessible{Colors.NC}")
         return False
 
+def wait_for_arangodb(timeout: float = 30.0) -> bool:
+    """Poll the ArangoDB HTTP endpoint with exponential backoff until it answers."""
+    import urllib.request
+    import urllib.error
+    
+    arango_host = os.environ.get('ARANGO_HOST', 'localhost')
+    arango_port = os.environ.get('ARANGO_PORT', '8529')
+    url = f"http://{arango_host}:{arango_port}/_api/version"
+    
+    deadline = time.monotonic() + timeout
+    delay = 0.25
+    while True:
+        try:
+            urllib.request.urlopen(url, timeout=1.0).close()
+            return True
+        except urllib.error.HTTPError:
+            # Any HTTP response (e.g. 401) means the server is up
+            return True
+        except OSError:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 5.0)
+
 async def run_dashboard_demo():
     """Run the live dashboard demo."""
     print(f"\n{Colors.GREEN}🌐 Starting Live Dashboard Demo...{Colors.NC}")
@@ -391,8 +502,6 @@ async def run_dashboard_demo():
     print(f"{Colors.YELLOW}💡 Dashboard will be available at http://localhost:8000{Colors.NC}")
     
     try:
-        from src.agentic_worm.core.system import create_demo_system
-        
         # Test ArangoDB connection first (especially in Docker)
         arango_ok = await test_arangodb_connection()
         if not arango_ok:
@@ -427,41 +536,42 @@ async def run_dashboard_demo():
             print(f"{Colors.YELLOW}⚠️ Dashboard not available, starting simulation only{Colors.NC}")
             await system.start_simulation()
         
-    except Exception as e:
-        print(f"{Colors.RED}❌ Dashboard demo failed: {e}{Colors.NC}")
+    except Exception:
+        logger.exception("Dashboard demo failed")
         print(f"{Colors.YELLOW}💡 Check that dependencies are installed: pip install -r requirements.txt{Colors.NC}")
-        import traceback
-        traceback.print_exc()
 
 async def run_openworm_test():
     """Run the OpenWorm integration test."""
     print(f"\n{Colors.GREEN}🔬 Starting OpenWorm Integration Test...{Colors.NC}")
     
     try:
-        import subprocess
-        
         print(f"{Colors.BLUE}🧪 Running comprehensive OpenWorm tests...{Colors.NC}")
         
-        result = subprocess.run([
+        proc = await asyncio.create_subprocess_exec(
             sys.executable, "scripts/test_openworm_integration.py"
-        ], capture_output=False)
-        
-        if result.returncode == 0:
+        )
+        try:
+            returncode = await proc.wait()
+        except (asyncio.CancelledError, KeyboardInterrupt):
+            # Don't leave the test process running behind the launcher
+            if proc.returncode is None:
+                proc.terminate()
+                await proc.wait()
+            raise
+        
+        if returncode == 0:
             print(f"\n{Colors.GREEN}✅ OpenWorm integration test completed!{Colors.NC}")
         else:
             print(f"\n{Colors.YELLOW}⚠️ OpenWorm test ended{Colors.NC}")
         
-    except Exception as e:
-        print(f"{Colors.RED}❌ OpenWorm test failed: {e}{Colors.NC}")
+    except Exception:
+        logger.exception("OpenWorm test failed")
 
 async def run_custom_behavior_designer():
     """Run the custom behavior designer."""
     print(f"\n{Colors.GREEN}🎯 Starting Custom Behavior Designer...{Colors.NC}")
     
     try:
-        from agentic_worm.core.state import create_initial_state
-        from agentic_worm.intelligence.workflow import AgenticWorkflow
-        
         print(f"{Colors.CYAN}🎨 Design your own worm behavior!{Colors.NC}")
         
         # Get user preferences
@@ -490,79 +600,91 @@ async def run_custom_behavior_designer():
         try:
             duration = int(input(f"{Colors.YELLOW}Duration in seconds (30-600): {Colors.NC}").strip())
             duration = max(30, min(600, duration))
-        except:
+        except ValueError:
             duration = 120
         
         print(f"\n{Colors.GREEN}🎯 Goal: {goal}{Colors.NC}")
         print(f"{Colors.GREEN}⏱️ Duration: {duration} seconds{Colors.NC}")
         
         # Run custom behavior
-        workflow = AgenticWorkflow(enable_learning=True)
-        await workflow.initialize()
+        workflow = await get_workflow(enable_learning=True)
         
         state = create_initial_state("custom_behavior")
         state["decision_context"]["current_goal"] = goal
         
         steps = duration // 2  # One step every 2 seconds
+        deadline = asyncio.get_running_loop().time()
+        next_log = 0
         
         for i in range(steps):
             state = await workflow.process_step(state)
             
-            if i % 5 == 0:
+            if i == next_log:
+                next_log += 5
                 fitness = state.get("fitness_score", 0)
                 decision = state.get("decision_context", {}).get("current_decision", "none")
                 print(f"🎯 Step {i}: Decision={decision} | Goal={goal} | Fitness={fitness:.3f}")
             
-            await asyncio.sleep(2)
+            deadline += 2
+            await sleep_until(deadline)
         
         print(f"\n{Colors.GREEN}✅ Custom behavior completed!{Colors.NC}")
         
-    except Exception as e:
-        print(f"{Colors.RED}❌ Custom behavior failed: {e}{Colors.NC}")
+    except Exception:
+        logger.exception("Custom behavior failed")
 
 async def run_performance_benchmark():
     """Run the performance benchmark."""
     print(f"\n{Colors.GREEN}📊 Starting Performance Benchmark...{Colors.NC}")
     
     try:
-        from agentic_worm.core.state import create_initial_state
-        from agentic_worm.intelligence.workflow import AgenticWorkflow
-        
         print(f"{Colors.CYAN}⚡ Testing AI decision-making speed and efficiency{Colors.NC}")
         
-        workflow = AgenticWorkflow(enable_learning=True)
-        await workflow.initialize()
+        workflow = await get_workflow(enable_learning=True)
         
         state = create_initial_state("benchmark")
         state["decision_context"]["current_goal"] = "optimize_performance"
         
         # Rapid-fire benchmark
         steps = 100
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         print(f"{Colors.YELLOW}🏃 Running {steps} rapid AI decision cycles...{Colors.NC}")
+        batch = 20
         
-        for i in range(steps):
-            state = await workflow.process_step(state)
+        for i in range(0, steps, batch):
+            elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+            steps_per_sec = i / elapsed if elapsed > 0 else 0
+            print(f"⚡ Step {i}: {steps_per_sec:.1f} steps/sec")
             
-            if i % 20 == 0:
-                elapsed = time.time() - start_time
-                steps_per_sec = i / elapsed if elapsed > 0 else 0
-                print(f"⚡ Step {i}: {steps_per_sec:.1f} steps/sec")
+            state = await workflow.process_steps(state, min(batch, steps - i))
         
-        total_time = time.time() - start_time
+        total_time = (time.perf_counter_ns() - start_ns) / 1e9
         avg_steps_per_sec = steps / total_time
         
-        print(f"\n{Colors.GREEN}📊 Benchmark Results:{Colors.NC}")
-        print(f"  • Total Steps: {steps}")
-        print(f"  • Total Time: {total_time:.2f} seconds") 
-        print(f"  • Average Speed: {avg_steps_per_sec:.1f} steps/second")
-        print(f"  • Final Fitness: {state.get('fitness_score', 0):.3f}")
-        
-        print(f"\n{Colors.GREEN}✅ Performance benchmark completed!{Colors.NC}")
-        
-    except Exception as e:
-        print(f"{Colors.RED}❌ Benchmark failed: {e}{Colors.NC}")
+        print(
+            f"\n{Colors.GREEN}📊 Benchmark Results:{Colors.NC}\n"
+            f"  • Total Steps: {steps}\n"
+            f"  • Total Time: {total_time:.2f} seconds\n"
+            f"  • Average Speed: {avg_steps_per_sec:.1f} steps/second\n"
+            f"  • Final Fitness: {state.get('fitness_score', 0):.3f}\n"
+            f"\n{Colors.GREEN}✅ Performance benchmark completed!{Colors.NC}"
+        )
+        
+    except Exception:
+        logger.exception("Benchmark failed")
+
+# Menu choice -> demo coroutine
+DEMOS = {
+    "1": run_food_seeking_demo,
+    "2": run_exploration_demo,
+    "3": run_obstacle_navigation_demo,
+    "4": run_neural_showcase_demo,
+    "5": run_dashboard_demo,
+    "6": run_openworm_test,
+    "7": run_custom_behavior_designer,
+    "8": run_performance_benchmark,
+}
 
 async def main():
     """Main demo launcher function."""
@@ -576,35 +698,28 @@ async def main():
             print(f"{Colors.CYAN}👋 Thanks for exploring Agentic Worm!{Colors.NC}")
             break
         
+        # The OpenWorm test runs in a subprocess; everything else needs the package
+        if IMPORT_ERROR is not None and choice != "6":
+            print(f"{Colors.RED}❌ Agentic Worm modules could not be imported: {IMPORT_ERROR}{Colors.NC}")
+            print(f"{Colors.YELLOW}💡 Check that dependencies are installed: pip install -r requirements.txt{Colors.NC}")
+            continue
+        
         # Run selected demo
         try:
-            if choice == "1":
-                await run_food_seeking_demo()
-            elif choice == "2":
-                await run_exploration_demo()
-            elif choice == "3":
-                await run_obstacle_navigation_demo()
-            elif choice == "4":
-                await run_neural_showcase_demo()
-            elif choice == "5":
-                await run_dashboard_demo()
-            elif choice == "6":
-                await run_openworm_test()
-            elif choice == "7":
-                await run_custom_behavior_designer()
-            elif choice == "8":
-                await run_performance_benchmark()
+            handler = DEMOS.get(choice)
+            if handler:
+                await handler()
                 
         except KeyboardInterrupt:
             print(f"\n{Colors.YELLOW}🛑 Demo interrupted{Colors.NC}")
-        except Exception as e:
-            print(f"\n{Colors.RED}❌ Demo error: {e}{Colors.NC}")
+        except Exception:
+            logger.exception("Demo error")
         
         # Ask if user wants to run another demo
         print(f"\n{Colors.YELLOW}Would you like to run another demo? (y/n): {Colors.NC}", end="")
         try:
             continue_choice = input().strip().lower()
-            if continue_choice not in ['y', 'yes']:
+            if continue_choice not in {'y', 'yes'}:
                 print(f"{Colors.CYAN}👋 Thanks for exploring Agentic Worm!{Colors.NC}")
                 break
         except KeyboardInterrupt:
@@ -613,24 +728,41 @@ async def main():
         
         print()  # Add spacing between demos
 
+def run_async(coro):
+    """Run ``coro`` on a fresh event loop (uvloop when installed), via asyncio.Runner on Python 3.11+."""
+    if sys.version_info >= (3, 11):
+        loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(coro)
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
 if __name__ == "__main__":
     import os
     
+    # Library modules log progress at INFO; the launcher only surfaces problems
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    
     try:
         # Auto-start dashboard if running in Docker or if choice is passed as argument
         if os.environ.get('AUTO_START_DASHBOARD') == 'true' or (len(sys.argv) > 1 and sys.argv[1] == '5'):
             print("🐳 Docker mode detected - Starting Live Dashboard Demo automatically...")
+            if IMPORT_ERROR is not None:
+                print(f"{Colors.RED}❌ Agentic Worm modules could not be imported: {IMPORT_ERROR}{Colors.NC}")
+                print(f"{Colors.YELLOW}💡 Check that dependencies are installed: pip install -r requirements.txt{Colors.NC}")
+                sys.exit(1)
             print("🌐 Dashboard will be available at http://localhost:8000")
             
             # Add delay for Docker startup to let ArangoDB initialize
             if os.environ.get('AUTO_START_DASHBOARD') == 'true':
                 print("⏳ Waiting for ArangoDB to initialize...")
-                import time
-                time.sleep(10)  # Give ArangoDB time to start
+                if not wait_for_arangodb():
+                    print("⚠️ ArangoDB did not respond in time, continuing anyway...")
                 
-            asyncio.run(run_dashboard_demo())
+            run_async(run_dashboard_demo())
         else:
-            asyncio.run(main())
+            run_async(main())
     except KeyboardInterrupt:
         print(f"\n{Colors.CYAN}👋 Thanks for trying Agentic Worm!{Colors.NC}")
     except Exception as e:
@@ -0,0 +1,37 @@
+"""
+Shared helpers for the demo and test scripts in this directory.
+
+Covers event loop setup (uvloop when installed, a small default executor)
+and batched console output.
+"""
+
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def install_event_loop_policy():
+    """Make asyncio.run use uvloop when it is installed."""
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def configure_running_loop():
+    """Tune the running event loop for these scripts and return it."""
+    # Small default executor: these scripts only hand it the odd blocking call
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=4, thread_name_prefix="aw"))
+    loop.slow_callback_duration = 0.1  # Reported when run with PYTHONASYNCIODEBUG=1
+    return loop
+
+
+def emit(lines):
+    """Write several newline-terminated lines to stdout in one call."""
+    sys.stdout.write("".join(lines))
+    sys.stdout.flush()
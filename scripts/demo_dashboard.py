@@ -7,13 +7,17 @@ visualization dashboard, showcasing AI decision-making in action.
 """
 
 import asyncio
+import itertools
 import sys
 import signal
 from pathlib import Path
+from typing import Optional
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from _script_utils import configure_running_loop, emit, install_event_loop_policy
+
 # Colors for output
 class Colors:
     RED = '\033[0;31m'
@@ -28,6 +32,13 @@ def print_colored(text: str, color: str = Colors.NC):
     """Print colored text."""
     print(f"{color}{text}{Colors.NC}")
 
+# Demo scenarios as (goal, description, duration in seconds), run in rotation
+SCENARIOS = (
+    ("find_food", "🍽️ Food Seeking", 60),
+    ("explore_environment", "🔍 Environment Exploration", 45),
+    ("navigate_obstacles", "🚧 Obstacle Navigation", 30),
+)
+
 class DashboardDemo:
     """Demo controller for the agentic worm dashboard."""
     
@@ -35,12 +46,9 @@ class DashboardDemo:
         self.system = None
         self.dashboard = None
         self.running = False
-        self.demo_scenarios = [
-            ("find_food", "🍽️ Food Seeking", 60),
-            ("explore_environment", "🔍 Environment Exploration", 45),
-            ("navigate_obstacles", "🚧 Obstacle Navigation", 30)
-        ]
-        self.current_scenario = 0
+        self._stop: Optional[asyncio.Event] = None
+        self._scenario_cycle = itertools.cycle(SCENARIOS)
+        self.current_scenario = next(self._scenario_cycle)
     
     async def initialize(self):
         """Initialize the agentic worm system and dashboard."""
@@ -49,10 +57,8 @@ class DashboardDemo:
         print()
         
         try:
-            from agentic_worm.core.system import AgenticWormSystem
-            from agentic_worm.core.state import create_initial_state
-            
             print_colored("🚀 Initializing Agentic Worm System...", Colors.BLUE)
+            from agentic_worm.core.system import AgenticWormSystem
             
             # Create system with visualization enabled
             self.system = AgenticWormSystem(
@@ -65,7 +71,7 @@ class DashboardDemo:
             
             if self.system.current_state:
                 # Set initial goal
-                goal, desc, _ = self.demo_scenarios[0]
+                goal, desc, _ = self.current_scenario
                 self.system.current_state["decision_context"]["current_goal"] = goal
                 self.system.current_state["decision_context"]["goal_priority"] = 1.0
                 
@@ -98,7 +104,8 @@ class DashboardDemo:
         print()
         
         # Setup signal handler for graceful shutdown
-        loop = asyncio.get_event_loop()
+        self._stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
         for sig in [signal.SIGINT, signal.SIGTERM]:
             loop.add_signal_handler(sig, self.signal_handler)
         
@@ -107,11 +114,10 @@ class DashboardDemo:
         try:
             # Start dashboard server if available
             if self.dashboard:
-                # Run dashboard and simulation concurrently
-                await asyncio.gather(
+                # Run dashboard and simulation together; if either fails the other is cancelled
+                await self._run_together(
                     self._run_dashboard_server(),
-                    self._run_simulation_demo(),
-                    return_exceptions=True
+                    self._run_simulation_demo()
                 )
             else:
                 # Run just the simulation
@@ -124,6 +130,36 @@ class DashboardDemo:
         finally:
             await self.cleanup()
     
+    async def _run_together(self, *coros):
+        """Run coroutines concurrently, cancelling the rest as soon as one raises."""
+        if sys.version_info >= (3, 11):
+            # A plain except clause rather than except*, which is a syntax error
+            # on the older Pythons this script still supports
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    for coro in coros:
+                        tg.create_task(coro)
+            except ExceptionGroup as eg:
+                # Surface the task's own error, as the asyncio.wait path does
+                for error in eg.exceptions[1:]:
+                    print_colored(f"⚠️ Concurrent task also failed: {error}", Colors.YELLOW)
+                raise eg.exceptions[0] from None
+            return
+        
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        errors = [task.exception() for task in done if not task.cancelled() and task.exception()]
+        for error in errors[1:]:
+            print_colored(f"⚠️ Concurrent task also failed: {error}", Colors.YELLOW)
+        if errors:
+            raise errors[0]
+    
     async def _run_dashboard_server(self):
         """Run the dashboard server."""
         if not self.dashboard:
@@ -134,6 +170,7 @@ class DashboardDemo:
             await self.dashboard.start_server()
         except Exception as e:
             print_colored(f"⚠️ Dashboard server error: {e}", Colors.YELLOW)
+            raise
     
     async def _run_simulation_demo(self):
         """Run the simulation demonstration."""
@@ -141,7 +178,13 @@ class DashboardDemo:
         print_colored("Watch the real-time decision-making process!", Colors.CYAN)
         print()
         
-        scenario_start_time = asyncio.get_event_loop().time()
+        # Tick on a fixed schedule so step time doesn't slow the frame rate
+        loop = asyncio.get_running_loop()
+        period = 1 / 20  # 20 FPS
+        next_tick = loop.time()
+        
+        scenario_start_time = next_tick
+        scenario_duration = self.current_scenario[2]
         scenario_steps = 0
         
         while self.running and self.system:
@@ -151,45 +194,66 @@ class DashboardDemo:
                 scenario_steps += 1
                 
                 # Check for scenario switching
-                goal, desc, duration = self.demo_scenarios[self.current_scenario]
-                elapsed = asyncio.get_event_loop().time() - scenario_start_time
-                
-                if elapsed >= duration:
+                if loop.time() - scenario_start_time >= scenario_duration:
                     # Switch to next scenario
                     await self._switch_scenario()
-                    scenario_start_time = asyncio.get_event_loop().time()
+                    scenario_start_time = loop.time()
+                    scenario_duration = self.current_scenario[2]
                     scenario_steps = 0
                 
                 # Progress update every 100 steps
                 if scenario_steps % 100 == 0 and self.system.current_state:
+                    _, desc, duration = self.current_scenario
+                    elapsed = loop.time() - scenario_start_time
                     progress = min(100, (elapsed / duration) * 100)
                     state = self.system.current_state
-                    decision = state["decision_context"].get("current_decision", "none")
-                    confidence = state["decision_context"].get("decision_confidence", 0)
+                    dc = state["decision_context"]
+                    decision = dc.get("current_decision", "none")
+                    confidence = dc.get("decision_confidence", 0)
                     fitness = state["fitness_score"]
                     
-                    print_colored(f"📊 {desc}: {progress:.0f}% | Decision: {decision} | "
-                                f"Confidence: {confidence:.2f} | Fitness: {fitness:.3f}", Colors.BLUE)
+                    emit((
+                        f"{Colors.BLUE}📊 {desc}: {progress:.0f}% | Decision: {decision} | "
+                        f"Confidence: {confidence:.2f} | Fitness: {fitness:.3f}{Colors.NC}\n",
+                    ))
                 
-                # Small delay to control simulation speed
-                await asyncio.sleep(0.05)  # 20 FPS
+                # Sleep until the next tick; resync if the step overran it
+                next_tick += period
+                delay = next_tick - loop.time()
+                if delay > 0:
+                    await self._wait_for_stop(delay)
+                else:
+                    next_tick = loop.time()
                 
             except Exception as e:
                 print_colored(f"⚠️ Simulation step error: {e}", Colors.YELLOW)
-                await asyncio.sleep(1.0)
+                await self._wait_for_stop(1.0)
+                next_tick = loop.time()
+    
+    async def _wait_for_stop(self, timeout: float):
+        """Sleep for up to ``timeout`` seconds, returning early on shutdown."""
+        if self._stop is None:
+            await asyncio.sleep(timeout)
+            return
+        
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
     
     async def _switch_scenario(self):
         """Switch to the next demonstration scenario."""
         # Move to next scenario (cycle through)
-        self.current_scenario = (self.current_scenario + 1) % len(self.demo_scenarios)
-        goal, desc, duration = self.demo_scenarios[self.current_scenario]
+        self.current_scenario = next(self._scenario_cycle)
+        goal, desc, duration = self.current_scenario
         
         # Update system goal
         if self.system and self.system.current_state:
-            old_goal = self.system.current_state["decision_context"]["current_goal"]
-            self.system.current_state["decision_context"]["current_goal"] = goal
-            self.system.current_state["decision_context"]["goal_priority"] = 1.0
-            self.system.current_state["decision_context"]["goal_progress"] = 0.0
+            dc = self.system.current_state["decision_context"]
+            old_goal = dc["current_goal"]
+            dc["current_goal"] = goal
+            dc["goal_priority"] = 1.0
+            dc["goal_progress"] = 0.0
             
             print_colored(f"\n🎯 Scenario Switch: {desc} (duration: {duration}s)", Colors.MAGENTA)
             print_colored(f"   Previous goal: {old_goal} → New goal: {goal}", Colors.CYAN)
@@ -204,6 +268,8 @@ class DashboardDemo:
         """Handle shutdown signals gracefully."""
         print_colored("\n🛑 Shutdown signal received...", Colors.YELLOW)
         self.running = False
+        if self._stop is not None:
+            self._stop.set()
     
     async def cleanup(self):
         """Clean up resources."""
@@ -230,6 +296,8 @@ class DashboardDemo:
 
 async def main():
     """Main demo function."""
+    configure_running_loop()
+    
     demo = DashboardDemo()
     
     # Print instructions
@@ -248,6 +316,8 @@ if __name__ == "__main__":
     print_colored("🎉 Starting Agentic Worm Dashboard Demo...", Colors.GREEN)
     print()
     
+    install_event_loop_policy()
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -4,16 +4,26 @@ Test the Agentic Workflow Implementation
 
 This script demonstrates the perception → cognition → action pipeline
 working with real decision-making logic.
+
+Set AW_TEST_STEP_DELAY to change the pause between pipeline steps
+(default 0.5 seconds); use 0 in CI to run without pauses.
 """
 
 import asyncio
+import copy
+import os
 import sys
 import time
 from pathlib import Path
 
+# Pause between pipeline steps, for readability when watching the output
+_STEP_DELAY = float(os.environ.get("AW_TEST_STEP_DELAY", "0.5"))
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from _script_utils import configure_running_loop, emit, install_event_loop_policy
+
 # Colors for output
 class Colors:
     RED = '\033[0;31m'
@@ -37,7 +47,7 @@ async def test_agentic_workflow():
     
     try:
         # Import our modules
-        from agentic_worm.core.state import create_initial_state, WormState
+        from agentic_worm.core.state import create_initial_state
         from agentic_worm.core.system import AgenticWormSystem
         
         print_colored("✅ Successfully imported agentic worm modules", Colors.GREEN)
@@ -84,9 +94,10 @@ async def test_agentic_workflow():
             print_colored(f"\n📍 Step {step + 1}:", Colors.YELLOW)
             
             # Store previous state for comparison
-            prev_decision = system.current_state["decision_context"].get("current_decision", "none")
-            prev_fitness = system.current_state["fitness_score"]
-            prev_energy = system.current_state["energy_level"]
+            st = system.current_state
+            prev_decision = st["decision_context"].get("current_decision", "none")
+            prev_fitness = st["fitness_score"]
+            prev_energy = st["energy_level"]
             
             # Execute one step
             await system._step_simulation()
@@ -95,32 +106,39 @@ async def test_agentic_workflow():
                 print_colored("❌ Current state became None after simulation step", Colors.RED)
                 break
             
-            # Show what happened
-            current_decision = system.current_state["decision_context"].get("current_decision", "none")
-            current_confidence = system.current_state["decision_context"].get("decision_confidence", 0)
-            current_fitness = system.current_state["fitness_score"]
-            current_energy = system.current_state["energy_level"]
+            # Show what happened; the step may have replaced the state, so rebind
+            st = system.current_state
+            dc = st["decision_context"]
+            current_decision = dc.get("current_decision", "none")
+            current_confidence = dc.get("decision_confidence", 0)
+            current_fitness = st["fitness_score"]
+            current_energy = st["energy_level"]
             
-            print(f"  🧠 Decision: {prev_decision} → {current_decision}")
-            print(f"  🎯 Confidence: {current_confidence:.2f}")
-            print(f"  ⚡ Fitness: {prev_fitness:.3f} → {current_fitness:.3f}")
-            print(f"  🔋 Energy: {prev_energy:.3f} → {current_energy:.3f}")
+            lines = [
+                f"  🧠 Decision: {prev_decision} → {current_decision}\n",
+                f"  🎯 Confidence: {current_confidence:.2f}\n",
+                f"  ⚡ Fitness: {prev_fitness:.3f} → {current_fitness:.3f}\n",
+                f"  🔋 Energy: {prev_energy:.3f} → {current_energy:.3f}\n",
+            ]
             
             # Show decision rationale if available
-            rationale = system.current_state["decision_context"].get("decision_rationale")
+            rationale = dc.get("decision_rationale")
             if rationale:
-                print(f"  💭 Rationale: {rationale}")
+                lines.append(f"  💭 Rationale: {rationale}\n")
             
             # Show if worm is moving/feeding
-            if system.current_state["is_moving"]:
-                print("  🚶 Status: Moving")
-            elif system.current_state["is_feeding"]:
-                print("  🍽️ Status: Feeding")
+            if st["is_moving"]:
+                lines.append("  🚶 Status: Moving\n")
+            elif st["is_feeding"]:
+                lines.append("  🍽️ Status: Feeding\n")
             else:
-                print("  😴 Status: Idle")
+                lines.append("  😴 Status: Idle\n")
+            
+            emit(lines)
             
             # Small delay for readability
-            await asyncio.sleep(0.5)
+            if _STEP_DELAY:
+                await asyncio.sleep(_STEP_DELAY)
         
         print()
         print_colored("📊 Final Results:", Colors.GREEN)
@@ -163,19 +181,21 @@ async def test_decision_scenarios():
             ("navigate_obstacles", "Obstacle avoidance")
         ]
         
+        # One initialized workflow and one base state shared by every scenario
+        workflow = AgenticWorkflow(enable_learning=True)
+        await workflow.initialize()
+        template_state = create_initial_state("test_template")
+        
         for goal, description in scenarios:
             print()
             print_colored(f"🧪 Testing: {description}", Colors.BLUE)
             
-            # Create fresh state
-            state = create_initial_state(f"test_{goal}")
+            # Fresh state forked from the template
+            state = copy.deepcopy(template_state)
+            state["worm_id"] = state["simulation_id"] = f"test_{goal}"
             state["decision_context"]["current_goal"] = goal
             state["decision_context"]["goal_priority"] = 1.0
             
-            # Create workflow
-            workflow = AgenticWorkflow(enable_learning=True)
-            await workflow.initialize()
-            
             # Run a few steps
             for i in range(3):
                 try:
@@ -197,11 +217,57 @@ async def test_decision_scenarios():
     except Exception as e:
         print_colored(f"❌ Scenario test failed: {e}", Colors.RED)
 
+async def test_memory_bulk_recording():
+    """Test batched experience recording against the memory store."""
+    
+    print()
+    print_colored("💾 Testing Bulk Experience Recording", Colors.CYAN)
+    print_colored("=" * 35, Colors.CYAN)
+    
+    try:
+        from agentic_worm.intelligence.workflow import AgenticWorkflow
+        
+        workflow = AgenticWorkflow(enable_learning=True)
+        await workflow.initialize()
+        
+        if not workflow.memory_manager:
+            print_colored("⚠️ Memory system not available - skipping bulk test", Colors.YELLOW)
+            return
+        
+        experiences = [
+            {
+                "location": {"x": float(i), "y": 0.0, "z": 0.0},
+                "goal": "test_goal",
+                "actions_taken": [{"type": "test", "action": "bulk_test_action"}],
+                "motor_commands": {"dorsal": 0.5, "ventral": 0.3, "pharynx_pump": 0.1},
+                "outcome": "success" if i % 2 == 0 else "failure",
+                "fitness_change": 0.1,
+                "energy_change": -0.05,
+                "tags": ["test", "bulk"]
+            }
+            for i in range(5)
+        ]
+        
+        exp_ids = await workflow.memory_manager.record_experiences_bulk(
+            "test_memory_bulk", experiences, batch_size=2
+        )
+        
+        if len(exp_ids) == len(experiences):
+            print_colored(f"✅ Recorded {len(exp_ids)} experiences in batches of 2", Colors.GREEN)
+        else:
+            print_colored(f"❌ Stored {len(exp_ids)} of {len(experiences)} experiences", Colors.RED)
+        
+    except Exception as e:
+        print_colored(f"❌ Bulk recording test failed: {e}", Colors.RED)
+
 async def main():
     """Main test function."""
+    configure_running_loop()
+    
     try:
         await test_agentic_workflow()
         await test_decision_scenarios()
+        await test_memory_bulk_recording()
         
         print()
         print_colored("🎉 All Tests Passed!", Colors.GREEN)
@@ -213,4 +279,5 @@ async def main():
         print_colored(f"\n❌ Test suite failed: {e}", Colors.RED)
 
 if __name__ == "__main__":
+    install_event_loop_policy()
     asyncio.run(main()) 
\ No newline at end of file
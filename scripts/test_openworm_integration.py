@@ -13,6 +13,8 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from _script_utils import configure_running_loop, install_event_loop_policy
+
 # Colors for output
 class Colors:
     RED = '\033[0;31m'
@@ -27,7 +29,12 @@ def print_colored(text: str, color: str = Colors.NC):
     print(f"{color}{text}{Colors.NC}")
 
 async def test_openworm_integration():
-    """Test OpenWorm integration features."""
+    """
+    Test OpenWorm integration features.
+    
+    Returns the initialized client so the workflow test can reuse it,
+    or None if the test failed.
+    """
     
     print_colored("🔬 Testing OpenWorm Integration", Colors.CYAN)
     print_colored("=" * 40, Colors.CYAN)
@@ -49,9 +56,15 @@ async def test_openworm_integration():
         
         print()
         
+        # The neural, sensory and body reads are independent, so issue them together
+        neural_state, sensory_data, body_state = await asyncio.gather(
+            client.get_neural_state(),
+            client.get_sensory_data(),
+            client.get_body_state()
+        )
+        
         # Test neural state
         print_colored("🧠 Testing Neural State Retrieval...", Colors.BLUE)
-        neural_state = await client.get_neural_state()
         
         if neural_state.get("simulated"):
             print_colored("📊 Fallback Neural Data:", Colors.YELLOW)
@@ -79,7 +92,6 @@ async def test_openworm_integration():
         
         # Test sensory data
         print_colored("👁️ Testing Sensory Data...", Colors.BLUE)
-        sensory_data = await client.get_sensory_data()
         
         if sensory_data.get("simulated"):
             print_colored("📡 Enhanced Simulation Sensory Data:", Colors.YELLOW)
@@ -122,7 +134,6 @@ async def test_openworm_integration():
         
         # Test body state
         print_colored("🤸 Testing Body Physics...", Colors.BLUE)
-        body_state = await client.get_body_state()
         
         position = body_state.get("position", {})
         orientation = body_state.get("orientation", {})
@@ -139,20 +150,27 @@ async def test_openworm_integration():
         
         print()
         
-        # Clean up
-        await client.close()
-        
         print_colored("✨ OpenWorm Integration Test Complete!", Colors.GREEN)
         print_colored("🔬 The system gracefully handles both real OpenWorm data", Colors.CYAN)
         print_colored("   and enhanced simulation when OpenWorm is unavailable", Colors.CYAN)
         
+        # Left open for test_workflow_integration; main() closes it
+        return client
+        
     except Exception as e:
         print_colored(f"❌ Integration test failed: {e}", Colors.RED)
         import traceback
         traceback.print_exc()
+        return None
 
-async def test_workflow_integration():
-    """Test the workflow with OpenWorm integration."""
+async def test_workflow_integration(client=None):
+    """
+    Test the workflow with OpenWorm integration.
+    
+    Args:
+        client: Initialized OpenWormClient to reuse; a new connection is
+            made through initialize_openworm() when omitted
+    """
     
     print()
     print_colored("🧠 Testing Workflow with OpenWorm Integration", Colors.CYAN)
@@ -162,11 +180,16 @@ async def test_workflow_integration():
     try:
         from agentic_worm.core.state import create_initial_state
         from agentic_worm.intelligence.workflow import AgenticWorkflow
-        from agentic_worm.intelligence.openworm import initialize_openworm
+        from agentic_worm.intelligence.openworm import initialize_openworm, set_openworm_client
         
-        # Initialize OpenWorm
-        print_colored("🔗 Initializing OpenWorm connection...", Colors.BLUE)
-        openworm_ready = await initialize_openworm()
+        # Initialize OpenWorm, reusing the probe test's client when available
+        if client is not None:
+            print_colored("🔗 Reusing OpenWorm connection...", Colors.BLUE)
+            set_openworm_client(client)
+            openworm_ready = client.is_connected or client.enable_fallback
+        else:
+            print_colored("🔗 Initializing OpenWorm connection...", Colors.BLUE)
+            openworm_ready = await initialize_openworm()
         
         if openworm_ready:
             print_colored("✅ OpenWorm integration ready", Colors.GREEN)
@@ -212,9 +235,12 @@ async def test_workflow_integration():
 
 async def main():
     """Main test function."""
+    configure_running_loop()
+    
+    client = None
     try:
-        await test_openworm_integration()
-        await test_workflow_integration()
+        client = await test_openworm_integration()
+        await test_workflow_integration(client)
         
         print()
         print_colored("🎉 All OpenWorm Integration Tests Passed!", Colors.GREEN)
@@ -224,11 +250,16 @@ async def main():
         print_colored("\n🛑 Test interrupted by user", Colors.YELLOW)
     except Exception as e:
         print_colored(f"\n❌ Test suite failed: {e}", Colors.RED)
+    finally:
+        if client is not None:
+            await client.close()
 
 if __name__ == "__main__":
     print_colored("🔬 Starting OpenWorm Integration Tests...", Colors.GREEN)
     print()
     
+    install_event_loop_policy()
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -10,7 +10,27 @@ __version__ = "0.1.0"
 __author__ = "Agentic Worm Team"
 __email__ = "team@agentic-worm.org"
 
-from .core import AgenticWormSystem
-from .demo import DemoRunner
+# Heavy submodules are imported on first attribute access (PEP 562), so
+# importing e.g. agentic_worm.intelligence.openworm doesn't pull in the
+# whole system and demo stack
+_LAZY_ATTRIBUTES = {
+    "AgenticWormSystem": ".core",
+    "DemoRunner": ".demo",
+}
 
-__all__ = ["AgenticWormSystem", "DemoRunner", "__version__"] 
\ No newline at end of file
+__all__ = ["AgenticWormSystem", "DemoRunner", "__version__"]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES)) 
\ No newline at end of file
@@ -16,8 +16,11 @@ from rich.console import Console
 from rich.logging import RichHandler
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .demo import DemoRunner, run_quick_demo
-from .core import create_demo_system
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Create CLI app
 app = typer.Typer(
@@ -29,16 +32,37 @@ app = typer.Typer(
 # Rich console for beautiful output
 console = Console()
 
-# Setup logging with Rich
-logging.basicConfig(
-    level="INFO",
-    format="%(message)s",
-    datefmt="[%X]",
-    handlers=[RichHandler(rich_tracebacks=True)]
-)
-
 logger = logging.getLogger(__name__)
 
+_logging_configured = False
+
+
+def _configure_logging():
+    """Set up Rich logging the first time a command runs."""
+    global _logging_configured
+    if _logging_configured:
+        return
+    logging.basicConfig(
+        level="INFO",
+        format="%(message)s",
+        datefmt="[%X]",
+        handlers=[RichHandler(rich_tracebacks=True)]
+    )
+    _logging_configured = True
+
+
+@app.callback()
+def _main_callback():
+    # Runs before any subcommand, but not for a bare `agentic-worm --help`
+    _configure_logging()
+
+
+def _run_async(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
 
 @app.command()
 def demo(
@@ -86,7 +110,7 @@ def demo(
             task = progress.add_task("Setting up demo...", total=None)
             
             # Run the demo asynchronously
-            results = asyncio.run(_run_demo_async(
+            results = _run_async(_run_demo_async(
                 demo_type, duration, output_dir, not no_recording, progress, task
             ))
         
@@ -112,7 +136,10 @@ def quick(
     console.print(f"🚀 [bold cyan]Quick Demo: {demo_type}[/bold cyan]")
     
     try:
-        results = asyncio.run(run_quick_demo(demo_type, duration))
+        # Imported here so commands like `status` don't load the simulation stack
+        from .demo.runner import run_quick_demo
+        
+        results = _run_async(run_quick_demo(demo_type, duration))
         _display_demo_results(results)
     except Exception as e:
         console.print(f"[red]Quick demo failed: {e}[/red]")
@@ -189,6 +216,7 @@ async def _run_demo_async(
     task_id
 ) -> dict:
     """Run demo asynchronously with progress tracking."""
+    from .demo import DemoRunner
     
     # Update progress
     progress.update(task_id, description="Initializing system...")
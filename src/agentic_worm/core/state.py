@@ -6,9 +6,13 @@ workflow, maintaining all necessary information about the worm's current conditi
 environment, and decision-making process.
 """
 
-from typing import Dict, List, Optional, Any, TypedDict
+from collections import deque
+from typing import Deque, Dict, List, Optional, Any, TypedDict
 import numpy as np
 
+# Number of recent messages kept on the state; older ones are dropped
+MESSAGE_HISTORY_LIMIT = 64
+
 
 class SensoryData(TypedDict):
     """Sensory input from the OpenWorm simulation."""
@@ -73,8 +77,8 @@ class WormState(TypedDict):
     This TypedDict defines the complete state that flows through the LangGraph
     workflow, containing all information needed for the worm's operation.
     """
-    # Message history for AI communication
-    messages: List[Dict[str, Any]]
+    # Recent message history for AI communication (bounded ring buffer)
+    messages: Deque[Dict[str, Any]]
     
     # Core simulation state
     sensory_data: SensoryData
@@ -84,6 +88,7 @@ class WormState(TypedDict):
     
     # Decision-making state
     decision_context: DecisionContext
+    decision_count: int  # Decisions made since the simulation started
     
     # Learning and adaptation
     learning_state: LearningState
@@ -120,7 +125,7 @@ def create_initial_state(simulation_id: str) -> WormState:
         WormState with default initial values
     """
     return WormState(
-        messages=[],
+        messages=deque(maxlen=MESSAGE_HISTORY_LIMIT),
         sensory_data=SensoryData(
             chemotaxis={},
             mechanosensory={},
@@ -158,6 +163,7 @@ def create_initial_state(simulation_id: str) -> WormState:
             current_decision="initialize_behavior",  # Default decision instead of None
             decision_rationale="Starting simulation with basic exploration behavior"
         ),
+        decision_count=0,
         learning_state=LearningState(
             recent_rewards=[],
             behavior_success_rates={},
@@ -8,9 +8,10 @@ and LangGraph workflow management.
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 import uuid
+import secrets
 
 from .state import WormState, create_initial_state
 
@@ -18,6 +19,65 @@ from .state import WormState, create_initial_state
 logger = logging.getLogger(__name__)
 
 
+def fitness_increment(goal_progress: float, energy: float, health: float,
+                      decision_confidence: float) -> float:
+    """
+    Fitness gained in one simulation step.
+    
+    Args:
+        goal_progress: Progress towards the current goal (0.0 to 1.0)
+        energy: Current energy level
+        health: Current health status
+        decision_confidence: Confidence of the latest decision
+        
+    Returns:
+        Amount to add to the fitness score
+    """
+    increment = 0.0
+    
+    # Reward goal progress
+    if goal_progress > 0.5:
+        increment += 0.001
+    
+    # Reward maintaining health and energy
+    if energy > 0.5 and health > 0.5:
+        increment += 0.0005
+    
+    # Reward making decisions (being active)
+    if decision_confidence > 0.7:
+        increment += 0.0003
+    
+    return increment
+
+
+def step_biological_metrics(energy: float, health: float, is_moving: bool,
+                            is_feeding: bool) -> Tuple[float, float]:
+    """
+    Advance energy and health by one simulation step.
+    
+    Args:
+        energy: Current energy level
+        health: Current health status
+        is_moving: Whether the worm is moving
+        is_feeding: Whether the worm is feeding
+        
+    Returns:
+        Updated (energy, health)
+    """
+    # Gradual energy consumption
+    energy = max(0.0, energy - (0.001 if is_moving else 0.0005))
+    
+    # Health slightly affected by low energy
+    if energy < 0.2:
+        health = max(0.0, health - 0.0002)
+    
+    # Feeding restores energy
+    if is_feeding:
+        energy = min(1.0, energy + 0.005)
+    
+    return energy, health
+
+
 class AgenticWormSystem:
     """
     Main orchestrator for the Agentic Worm system.
@@ -61,6 +121,9 @@ class AgenticWormSystem:
         self.is_running = False
         self.is_initialized = False
         
+        # Main loop period in seconds (100 Hz)
+        self._dt = 0.01
+        
         logger.info(f"AgenticWormSystem initialized with ID: {self.simulation_id}")
     
     async def initialize(self) -> None:
@@ -121,9 +184,12 @@ class AgenticWormSystem:
         logger.info("Stopping Agentic Worm simulation...")
         self.is_running = False
         
-        # Cleanup components
-        # TODO: Implement proper cleanup once components are implemented
-        pass
+        # Release the memory system's database connections
+        workflow = getattr(self, "agentic_workflow", None)
+        memory_manager = getattr(workflow, "memory_manager", None)
+        if memory_manager:
+            memory_manager.close()
+            workflow.memory_manager = None
         
         logger.info("Simulation stopped")
     
@@ -230,16 +296,25 @@ class AgenticWormSystem:
     
     async def _run_main_loop(self) -> None:
         """Run the main simulation control loop."""
+        # Step on a fixed schedule so step time doesn't pull the rate below 100 Hz
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        
         while self.is_running:
             try:
                 # Step the simulation
                 await self._step_simulation()
                 
-                # Small delay to prevent overwhelming the system
-                await asyncio.sleep(0.01)  # 100 Hz update rate
+                # Sleep until the next tick; resync if the step overran it
+                next_tick += self._dt
+                delay = next_tick - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    next_tick = loop.time()
                 
             except Exception as e:
-                logger.error(f"Error in main loop: {e}")
+                logger.error("Error in main loop: %s", e)
                 break
     
     async def _step_simulation(self) -> None:
@@ -249,7 +324,7 @@ class AgenticWormSystem:
         
         # Update step count and simulation time
         self.current_state["step_count"] += 1
-        self.current_state["simulation_time"] += 0.01  # 10ms time step
+        self.current_state["simulation_time"] += self._dt
         
         # Initialize motor commands if not present
         if not self.current_state.get("motor_commands"):
@@ -278,11 +353,12 @@ class AgenticWormSystem:
                     if confidence is None or not isinstance(confidence, (int, float)):
                         confidence = 0.0
                         
-                    logger.info(f"Step {self.current_state['step_count']}: Decision: {decision}, "
-                              f"Confidence: {confidence:.2f}, Fitness: {self.current_state['fitness_score']:.3f}")
+                    logger.info("Step %d: Decision: %s, Confidence: %.2f, Fitness: %.3f",
+                              self.current_state["step_count"], decision, confidence,
+                              self.current_state["fitness_score"])
                 
             except Exception as e:
-                logger.error(f"⚠️ Agentic workflow step failed: {e}")
+                logger.error("⚠️ Agentic workflow step failed: %s", e)
                 # Fallback behavior
                 self._fallback_behavior()
         else:
@@ -300,7 +376,7 @@ class AgenticWormSystem:
                 memory_stats = await self.agentic_workflow.memory_manager.get_memory_statistics(self.current_state["worm_id"])
                 self.current_state["memory_stats"] = memory_stats
             except Exception as e:
-                logger.warning(f"⚠️ Memory statistics update failed: {e}")
+                logger.warning("⚠️ Memory statistics update failed: %s", e)
                 # Provide realistic fallback data
                 step_count = self.current_state["step_count"]
                 episodes = min(50, max(0, step_count // 1000))  # 1 episode per 1000 steps
@@ -352,59 +428,37 @@ class AgenticWormSystem:
             try:
                 await self.visualizer.update_from_state(self.current_state)
             except Exception as e:
-                logger.error(f"⚠️ Visualization update failed: {e}")
+                logger.error("⚠️ Visualization update failed: %s", e)
     
     def _update_fitness_score(self) -> None:
         """Update fitness score based on goal achievement and behavior."""
-        if not self.current_state:
+        state = self.current_state
+        if not state:
             return
-            
-        # Get current metrics
-        goal = self.current_state["decision_context"]["current_goal"]
-        goal_progress = self.current_state["decision_context"]["goal_progress"]
-        energy = self.current_state["energy_level"]
-        health = self.current_state["health_status"]
         
-        # Calculate fitness based on multiple factors
-        fitness_increment = 0.0
+        dc = state["decision_context"]
+        increment = fitness_increment(
+            dc["goal_progress"],
+            state["energy_level"],
+            state["health_status"],
+            dc.get("decision_confidence", 0)
+        )
         
-        # Reward goal progress
-        if goal_progress > 0.5:
-            fitness_increment += 0.001
-        
-        # Reward maintaining health and energy
-        if energy > 0.5 and health > 0.5:
-            fitness_increment += 0.0005
-            
-        # Reward making decisions (being active)
-        if self.current_state["decision_context"].get("decision_confidence", 0) > 0.7:
-            fitness_increment += 0.0003
-            
         # Update fitness with bounds
-        self.current_state["fitness_score"] = min(1.0, 
-            self.current_state["fitness_score"] + fitness_increment)
+        state["fitness_score"] = min(1.0, state["fitness_score"] + increment)
     
     def _update_biological_metrics(self) -> None:
         """Update energy and health metrics."""
-        if not self.current_state:
+        state = self.current_state
+        if not state:
             return
-            
-        # Gradual energy consumption
-        energy_consumption = 0.001 if self.current_state["is_moving"] else 0.0005
-        self.current_state["energy_level"] = max(0.0, 
-            self.current_state["energy_level"] - energy_consumption)
-        
-        # Health slightly affected by low energy
-        if self.current_state["energy_level"] < 0.2:
-            health_decline = 0.0002
-            self.current_state["health_status"] = max(0.0,
-                self.current_state["health_status"] - health_decline)
         
-        # Feeding restores energy
-        if self.current_state["is_feeding"]:
-            energy_gain = 0.005
-            self.current_state["energy_level"] = min(1.0,
-                self.current_state["energy_level"] + energy_gain)
+        state["energy_level"], state["health_status"] = step_biological_metrics(
+            state["energy_level"],
+            state["health_status"],
+            state["is_moving"],
+            state["is_feeding"]
+        )
     
     def _fallback_behavior(self) -> None:
         """Fallback behavior when agentic workflow is not available."""
@@ -455,7 +509,7 @@ async def create_demo_system(enable_visualization: bool = True) -> AgenticWormSy
         Configured AgenticWormSystem ready for demo
     """
     system = AgenticWormSystem(
-        simulation_id=f"demo_{uuid.uuid4().hex[:8]}",
+        simulation_id=f"demo_{secrets.token_hex(4)}",
         enable_visualization=enable_visualization,
         enable_learning=True
     )
@@ -13,12 +13,28 @@ from typing import Dict, List, Optional, Any
 from pathlib import Path
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..core import AgenticWormSystem
 
 
 logger = logging.getLogger(__name__)
 
 
+def _encode_metrics_line(metrics: Dict[str, Any]) -> str:
+    """Encode one metrics sample as a JSON Lines record."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(metrics, option=orjson.OPT_SERIALIZE_NUMPY).decode() + "\n"
+        except TypeError:
+            pass  # Types orjson rejects go through the stdlib encoder below
+    return json.dumps(metrics, separators=(",", ":"), default=str) + "\n"
+
+
 class DemoRunner:
     """
     Demo runner for showcasing Agentic Worm capabilities.
@@ -51,6 +67,7 @@ class DemoRunner:
         # Demo state
         self.system: Optional[AgenticWormSystem] = None
         self.start_time: Optional[float] = None
+        self._start_monotonic: Optional[float] = None  # For elapsed-time math
         self.metrics_history: List[Dict[str, Any]] = []
         self.is_running = False
         
@@ -187,8 +204,8 @@ class DemoRunner:
         metrics = await self.system.get_performance_metrics()
         
         # Add demo-specific metrics
-        if self.start_time:
-            metrics["demo_elapsed_time"] = time.time() - self.start_time
+        if self._start_monotonic is not None:
+            metrics["demo_elapsed_time"] = time.monotonic() - self._start_monotonic
             metrics["demo_progress"] = min(1.0, metrics["demo_elapsed_time"] / self.duration_seconds)
         
         return metrics
@@ -209,6 +226,7 @@ class DemoRunner:
     async def _run_demo_loop(self) -> Dict[str, Any]:
         """Run the main demo loop."""
         self.start_time = time.time()
+        self._start_monotonic = time.monotonic()
         self.is_running = True
         
         # Start the simulation in the background
@@ -218,63 +236,90 @@ class DemoRunner:
         metrics_task = asyncio.create_task(self._collect_metrics())
         
         try:
-            # Wait for demo duration or simulation completion
-            await asyncio.wait_for(
-                asyncio.gather(simulation_task, metrics_task),
-                timeout=self.duration_seconds
+            # Wait for demo duration or until either task finishes
+            done, _ = await asyncio.wait(
+                {simulation_task, metrics_task},
+                timeout=self.duration_seconds,
+                return_when=asyncio.FIRST_COMPLETED
             )
-        except asyncio.TimeoutError:
-            logger.info("Demo completed - time limit reached")
-        except Exception as e:
-            logger.error(f"Demo loop error: {e}")
+            if not done:
+                logger.info("Demo completed - time limit reached")
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    logger.error(f"Demo loop error: {task.exception()}")
         finally:
             self.is_running = False
             
             # Stop the simulation
             await self.system.stop_simulation()
             
-            # Cancel remaining tasks
-            for task in [simulation_task, metrics_task]:
-                if not task.done():
-                    task.cancel()
+            # Cancel remaining tasks and let them unwind
+            pending = [task for task in (simulation_task, metrics_task) if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
         
         return {
-            "duration": time.time() - self.start_time,
+            "duration": time.monotonic() - self._start_monotonic,
             "metrics_collected": len(self.metrics_history),
             "final_state": await self.system.get_current_state()
         }
     
     async def _collect_metrics(self) -> None:
         """Collect metrics during the demo run."""
-        while self.is_running:
+        # Sample every 100ms on a fixed schedule
+        loop = asyncio.get_running_loop()
+        period = 0.1
+        next_tick = loop.time()
+        
+        # Bound once; this runs alongside the 100 Hz simulation loop
+        wall_time = time.time
+        append = self.metrics_history.append
+        
+        # Stream each sample to a JSON Lines file as it is collected
+        metrics_file = None
+        if self.enable_recording:
             try:
-                metrics = await self.get_real_time_metrics()
-                metrics["timestamp"] = time.time()
-                
-                self.metrics_history.append(metrics)
-                
-                # Save metrics if recording is enabled
-                if self.enable_recording and len(self.metrics_history) % 100 == 0:
-                    await self._save_metrics_checkpoint()
-                
-                await asyncio.sleep(0.1)  # Collect metrics every 100ms
-                
-            except Exception as e:
-                logger.error(f"Metrics collection error: {e}")
-                await asyncio.sleep(1.0)  # Wait longer on error
-    
-    async def _save_metrics_checkpoint(self) -> None:
-        """Save a checkpoint of metrics data."""
-        if not self.enable_recording:
-            return
+                metrics_file = open(
+                    self.output_dir / f"{self.demo_name}_metrics.jsonl", "w", buffering=1 << 16
+                )
+            except OSError as e:
+                logger.error(f"Failed to open metrics file: {e}")
         
+        try:
+            while self.is_running:
+                try:
+                    metrics = await self.get_real_time_metrics()
+                    metrics["timestamp"] = wall_time()
+                    
+                    append(metrics)
+                    if metrics_file:
+                        metrics_file.write(_encode_metrics_line(metrics))
+                    
+                    next_tick += period
+                    delay = next_tick - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    else:
+                        next_tick = loop.time()
+                    
+                except Exception as e:
+                    logger.error(f"Metrics collection error: {e}")
+                    await asyncio.sleep(1.0)  # Wait longer on error
+                    next_tick = loop.time()
+        finally:
+            if metrics_file:
+                metrics_file.close()
+    
+    def _save_metrics_snapshot(self) -> None:
+        """Write the full metrics history as a single JSON array."""
         metrics_file = self.output_dir / f"{self.demo_name}_metrics.json"
         
         try:
             with open(metrics_file, 'w') as f:
-                json.dump(self.metrics_history, f, indent=2)
+                json.dump(self.metrics_history, f, indent=2, default=str)
         except Exception as e:
-            logger.error(f"Failed to save metrics checkpoint: {e}")
+            logger.error(f"Failed to save metrics snapshot: {e}")
     
     async def _generate_demo_summary(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a summary of the demo results."""
@@ -310,9 +355,9 @@ class DemoRunner:
         if self.system:
             await self.system.stop_simulation()
         
-        # Final metrics save
+        # Final metrics snapshot alongside the streamed JSON Lines file
         if self.enable_recording and self.metrics_history:
-            await self._save_metrics_checkpoint()
+            self._save_metrics_snapshot()
         
         logger.info("Demo cleanup completed")
 
@@ -8,7 +8,7 @@ autonomous behavior using LangGraph workflows.
 from .workflow import AgenticWorkflow
 from .nodes import PerceptionNode, CognitionNode, DecisionNode, MotorNode
 from .tools import SensoryTools, MotorTools
-from .openworm import OpenWormClient, get_openworm_client, initialize_openworm
+from .openworm import OpenWormClient, get_openworm_client, set_openworm_client, initialize_openworm
 
 __all__ = [
     "AgenticWorkflow", 
@@ -20,5 +20,6 @@ __all__ = [
     "MotorTools",
     "OpenWormClient",
     "get_openworm_client",
+    "set_openworm_client",
     "initialize_openworm"
 ] 
\ No newline at end of file
@@ -8,49 +8,36 @@ from typing import Dict, Any
 from ..core.state import WormState
 
 
-class PerceptionNode:
-    """Processes sensory input from the environment."""
+class PipelineNode:
+    """Base class for a stage in the perception-cognition-action pipeline."""
     
-    def __init__(self):
-        self.name = "perception"
+    name = "node"
     
     async def process(self, state: WormState) -> WormState:
-        """Process sensory input and update state."""
+        """Process the state for this stage; the base stage passes it through."""
         # Placeholder implementation
         return state
 
 
-class CognitionNode:
-    """Performs cognitive processing and situation assessment."""
+class PerceptionNode(PipelineNode):
+    """Processes sensory input from the environment."""
     
-    def __init__(self):
-        self.name = "cognition"
+    name = "perception"
+
+
+class CognitionNode(PipelineNode):
+    """Performs cognitive processing and situation assessment."""
     
-    async def process(self, state: WormState) -> WormState:
-        """Analyze situation and update cognitive state."""
-        # Placeholder implementation
-        return state
+    name = "cognition"
 
 
-class DecisionNode:
+class DecisionNode(PipelineNode):
     """Makes behavioral decisions based on cognitive assessment."""
     
-    def __init__(self):
-        self.name = "decision"
-    
-    async def process(self, state: WormState) -> WormState:
-        """Make behavioral decisions."""
-        # Placeholder implementation
-        return state
+    name = "decision"
 
 
-class MotorNode:
+class MotorNode(PipelineNode):
     """Generates motor commands for execution."""
     
-    def __init__(self):
-        self.name = "motor"
-    
-    async def process(self, state: WormState) -> WormState:
-        """Generate and execute motor commands."""
-        # Placeholder implementation
-        return state 
\ No newline at end of file
+    name = "motor"
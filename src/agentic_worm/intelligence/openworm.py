@@ -267,6 +267,11 @@ def get_openworm_client() -> OpenWormClient:
         _openworm_client = OpenWormClient()
     return _openworm_client
 
+def set_openworm_client(client: OpenWormClient) -> None:
+    """Use an already-initialized client as the global OpenWorm client."""
+    global _openworm_client
+    _openworm_client = client
+
 async def initialize_openworm() -> bool:
     """Initialize global OpenWorm client."""
     client = get_openworm_client()
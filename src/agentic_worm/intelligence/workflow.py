@@ -8,6 +8,8 @@ to generate intelligent behavior in a proper LangGraph workflow.
 
 import asyncio
 import logging
+from collections import deque
+from types import MappingProxyType
 from typing import Dict, Any, Optional, TypedDict, Literal, Annotated
 from datetime import datetime
 
@@ -25,11 +27,15 @@ except ImportError:
     END = "END"
     START = "START"
 
-from ..core.state import WormState
+from ..core.state import WormState, MESSAGE_HISTORY_LIMIT
 from ..memory import WormMemoryManager, MemoryType
 
 logger = logging.getLogger(__name__)
 
+# Read-only defaults shared by every recorded experience
+_ORIGIN_LOCATION = MappingProxyType({"x": 0.0, "y": 0.0, "z": 0.0})
+_IDLE_MOTOR_COMMANDS = MappingProxyType({"dorsal": 0.0, "ventral": 0.0, "pharynx_pump": 0.0})
+
 
 class LangGraphWormState(TypedDict):
     """
@@ -123,23 +129,6 @@ class AgenticWorkflow:
                 enable_consolidation=True,
                 consolidation_interval_hours=24
             )
-            
-            # Test the memory manager initialization
-            logger.info("🧪 Testing memory manager initialization...")
-            initialization_success = await self.memory_manager.initialize()
-            
-            if initialization_success:
-                logger.info("✅ Memory manager initialized successfully")
-                
-                # Test basic operations
-                test_success = await self.memory_manager.test_basic_operations("test_worm_001")
-                if test_success:
-                    logger.info("🎉 Memory system fully operational!")
-                else:
-                    logger.warning("⚠️ Memory system initialized but basic operations failed")
-            else:
-                logger.error("❌ Memory manager initialization failed")
-                self.memory_manager = None
                 
         except Exception as e:
             logger.error(f"❌ Memory manager initialization failed: {e}")
@@ -199,6 +188,12 @@ class AgenticWorkflow:
     
     async def initialize(self) -> None:
         """Initialize the LangGraph workflow system."""
+        if self.is_initialized:
+            return
+        
+        if self.memory_manager is not None:
+            await self._initialize_memory()
+        
         if LANGGRAPH_AVAILABLE and self.workflow_graph is not None:
             self.is_initialized = True
             print("✅ LangGraph workflow initialized successfully")
@@ -206,6 +201,35 @@ class AgenticWorkflow:
             print("⚠️ Using fallback workflow initialization")
             self.is_initialized = True
     
+    async def _initialize_memory(self) -> None:
+        """Connect the memory manager and verify basic operations."""
+        try:
+            # Test the memory manager initialization
+            logger.info("🧪 Testing memory manager initialization...")
+            initialization_success = await self.memory_manager.initialize()
+            
+            if initialization_success:
+                logger.info("✅ Memory manager initialized successfully")
+                
+                # Test basic operations
+                test_success = await self.memory_manager.test_basic_operations("test_worm_001")
+                if test_success:
+                    logger.info("🎉 Memory system fully operational!")
+                else:
+                    logger.warning("⚠️ Memory system initialized but basic operations failed")
+            else:
+                logger.error("❌ Memory manager initialization failed")
+                self.memory_manager = None
+                
+        except Exception as e:
+            logger.error(f"❌ Memory manager initialization failed: {e}")
+            self.memory_manager = None
+    
+    def reset_metrics(self) -> None:
+        """Reset the per-run decision and success counters."""
+        self.decision_count = 0
+        self.successful_actions = 0
+    
     async def process_step(self, state: WormState) -> WormState:
         """
         Process one step using the LangGraph workflow.
@@ -224,6 +248,24 @@ class AgenticWorkflow:
         else:
             return await self._process_with_fallback(state)
     
+    async def process_steps(self, state: WormState, n: int, yield_every: int = 20) -> WormState:
+        """
+        Process ``n`` consecutive steps in a single coroutine.
+        
+        Args:
+            state: Current worm state
+            n: Number of steps to run
+            yield_every: Hand control back to the event loop after this many steps
+            
+        Returns:
+            Worm state after the last step
+        """
+        for i in range(1, n + 1):
+            state = await self.process_step(state)
+            if i % yield_every == 0:
+                await asyncio.sleep(0)
+        return state
+    
     async def _process_with_langgraph(self, state: WormState) -> WormState:
         """Process using real LangGraph StateGraph."""
         try:
@@ -246,6 +288,7 @@ class AgenticWorkflow:
             updated_state = self._convert_from_langgraph_state(result, state)
             
             self.decision_count += 1
+            updated_state["decision_count"] = updated_state.get("decision_count", 0) + 1
             print(f"🧠 LangGraph step {self.decision_count} completed successfully")
             
             return updated_state
@@ -275,7 +318,7 @@ class AgenticWorkflow:
             
             # Add message for tracking
             if "messages" not in state:
-                state["messages"] = []
+                state["messages"] = deque(maxlen=MESSAGE_HISTORY_LIMIT)
             
             state["messages"].append({
                 "role": "system",
@@ -284,6 +327,7 @@ class AgenticWorkflow:
             })
             
             self.decision_count += 1
+            state["decision_count"] = state.get("decision_count", 0) + 1
             return state
             
         except Exception as e:
@@ -657,7 +701,7 @@ class AgenticWorkflow:
             if self.memory_manager:
                 try:
                     worm_id = state["worm_id"]
-                    location = state.get("position", {"x": 0.0, "y": 0.0, "z": 0.0})
+                    location = state.get("position", _ORIGIN_LOCATION)
                     motor_commands = state.get("motor_commands", {})
                 
                     actions_taken = [
@@ -696,7 +740,7 @@ class AgenticWorkflow:
                         safe_motor_commands["pharynx_pump"] = float(motor_commands.get("pharynx_pump", 0.0))
                     else:
                         # Default values if motor_commands is not a dict
-                        safe_motor_commands = {"dorsal": 0.0, "ventral": 0.0, "pharynx_pump": 0.0}
+                        safe_motor_commands = _IDLE_MOTOR_COMMANDS
                     
                     # Record the experience in episodic memory
                     experience_id = await self.memory_manager.record_experience(
@@ -753,7 +797,7 @@ class AgenticWorkflow:
                                 context={
                                     "fitness_before": fitness_before,
                                     "energy_before": energy_before,
-                                    "location": location,
+                                    "location": dict(location),  # may be the read-only default
                                     "outcome": outcome
                                 },
                                 tags=[goal, strategy, "auto_generated", "successful"]
@@ -851,7 +895,7 @@ class AgenticWorkflow:
         
         # Convert LangGraph messages to simple format
         if "messages" not in original_state:
-            original_state["messages"] = []
+            original_state["messages"] = deque(maxlen=MESSAGE_HISTORY_LIMIT)
         
         for msg in langgraph_state["messages"]:
             if hasattr(msg, 'content'):
@@ -7,6 +7,9 @@ coordinating between different memory types and the LangGraph workflow.
 
 import uuid
 import asyncio
+import secrets
+import time
+from itertools import count, islice
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
@@ -19,6 +22,41 @@ from .storage import ArangoMemoryStore
 
 logger = logging.getLogger(__name__)
 
+# Memory document keys are a sequence number plus a per-process random
+# suffix, so minting one doesn't read /dev/urandom on every experience.
+# The varying part comes first so shortened ids stay distinguishable.
+_ID_SUFFIX = uuid.uuid4().hex
+_id_sequence = count(1)
+
+
+def _new_memory_id() -> str:
+    """Return a unique key for a new memory document."""
+    return f"{next(_id_sequence):x}-{_ID_SUFFIX}"
+
+# How long get_memory_statistics results are reused before re-querying
+STATS_CACHE_TTL_SECONDS = 0.5
+
+# Experiences sent per bulk-import request; large enough to amortise the
+# round-trip, small enough to keep request bodies modest
+BULK_BATCH_SIZE = 256
+
+# AQL used by get_memory_statistics; kept constant so ArangoDB can reuse plans
+MEMORY_STATISTICS_AQL = """
+LET experiences = FIRST(
+    FOR doc IN @@episodic FILTER doc.worm_id == @worm_id
+    COLLECT AGGREGATE total = COUNT(1), wins = SUM(doc.outcome == 'success' ? 1 : 0)
+    RETURN {total, wins}
+)
+RETURN {
+    episodic: experiences.total,
+    successes: experiences.wins,
+    semantic: FIRST(FOR doc IN @@semantic FILTER doc.worm_id == @worm_id COLLECT WITH COUNT INTO length RETURN length),
+    spatial: FIRST(FOR doc IN @@spatial FILTER doc.worm_id == @worm_id COLLECT WITH COUNT INTO length RETURN length),
+    procedural: FIRST(FOR doc IN @@procedural FILTER doc.worm_id == @worm_id COLLECT WITH COUNT INTO length RETURN length),
+    locations: COUNT_DISTINCT(FOR doc IN @@spatial FILTER doc.worm_id == @worm_id RETURN doc.coordinates)
+}
+"""
+
 
 class WormMemoryManager:
     """
@@ -78,6 +116,9 @@ class WormMemoryManager:
         # Consolidation tracking
         self.last_consolidation = {}  # worm_id -> timestamp
         
+        # Short-lived statistics cache: worm_id -> (monotonic timestamp, stats)
+        self._stats_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        
         logger.info("WormMemoryManager initialized")
     
     async def initialize(self) -> bool:
@@ -114,12 +155,8 @@ class WormMemoryManager:
             logger.info("🧪 Testing basic memory operations...")
             
             # Test experience storage
-            from .types import Experience
-            from datetime import datetime
-            import uuid
-            
             test_experience = Experience(
-                experience_id=f"test_{uuid.uuid4().hex[:8]}",
+                experience_id=f"test_{secrets.token_hex(4)}",
                 worm_id=worm_id,
                 timestamp=datetime.now(),
                 location={"x": 0.0, "y": 0.0, "z": 0.0},
@@ -134,18 +171,21 @@ class WormMemoryManager:
                 tags=["test", "initialization"]
             )
             
+            test_kwargs = {
+                "location": test_experience.location,
+                "goal": test_experience.goal,
+                "actions_taken": test_experience.actions_taken,
+                "motor_commands": test_experience.motor_commands,
+                "outcome": test_experience.outcome,
+                "fitness_change": test_experience.fitness_change,
+                "energy_change": test_experience.energy_change,
+                "duration": test_experience.duration,
+                "environment_state": test_experience.environment_state,
+                "tags": test_experience.tags
+            }
+            
             experience_id = await self.record_experience(
-                worm_id=test_experience.worm_id,
-                location=test_experience.location,
-                goal=test_experience.goal,
-                actions_taken=test_experience.actions_taken,
-                motor_commands=test_experience.motor_commands,
-                outcome=test_experience.outcome,
-                fitness_change=test_experience.fitness_change,
-                energy_change=test_experience.energy_change,
-                duration=test_experience.duration,
-                environment_state=test_experience.environment_state,
-                tags=test_experience.tags
+                worm_id=test_experience.worm_id, **test_kwargs
             )
             
             if experience_id:
@@ -171,7 +211,8 @@ class WormMemoryManager:
         energy_change: float = 0.0,
         duration: float = 1.0,
         environment_state: Optional[Dict[str, Any]] = None,
-        tags: Optional[List[str]] = None
+        tags: Optional[List[str]] = None,
+        sync: Optional[bool] = None
     ) -> str:
         """
         Record a new experience in episodic memory.
@@ -188,12 +229,13 @@ class WormMemoryManager:
             duration: Duration of experience
             environment_state: State of environment
             tags: Optional tags for categorization
+            sync: Wait for the insert to reach disk (None uses the collection default)
             
         Returns:
             Experience ID
         """
         experience = Experience(
-            experience_id=str(uuid.uuid4()),
+            experience_id=_new_memory_id(),
             worm_id=worm_id,
             timestamp=datetime.now(),
             location=location,
@@ -210,13 +252,14 @@ class WormMemoryManager:
         )
         
         # Store in database
-        exp_id = await self.storage.store_experience(experience)
+        exp_id = await self.storage.store_experience(experience, sync=sync)
         
         # Update spatial memory
         await self._update_spatial_memory(worm_id, location, outcome, duration)
         
         # Cache recent experience
         self.memory_cache[MemoryType.EPISODIC][exp_id] = experience
+        self._stats_cache.pop(worm_id, None)
         
         # Check if consolidation is needed
         if self.enable_consolidation:
@@ -225,6 +268,100 @@ class WormMemoryManager:
         logger.info(f"Recorded experience {exp_id} for worm {worm_id}")
         return exp_id
     
+    async def record_experiences_bulk(
+        self,
+        worm_id: str,
+        experiences: List[Dict[str, Any]],
+        sync: bool = False,
+        batch_size: int = BULK_BATCH_SIZE
+    ) -> List[str]:
+        """
+        Record several experiences with one database round-trip per batch.
+        
+        Args:
+            worm_id: ID of the worm
+            experiences: Keyword dictionaries accepted by ``record_experience``
+                (without ``worm_id``)
+            sync: Wait for the batch to reach disk
+            batch_size: Maximum experiences sent in a single request
+            
+        Returns:
+            List of experience IDs that were stored
+        """
+        now = datetime.now()
+        records = []
+        
+        for exp in experiences:
+            outcome = exp["outcome"]
+            fitness_change = exp["fitness_change"]
+            records.append(Experience(
+                experience_id=_new_memory_id(),
+                worm_id=worm_id,
+                timestamp=now,
+                location=exp["location"],
+                goal=exp["goal"],
+                environment_state=exp.get("environment_state") or {},
+                actions_taken=exp["actions_taken"],
+                motor_commands=exp["motor_commands"],
+                outcome=outcome,
+                fitness_change=fitness_change,
+                energy_change=exp.get("energy_change", 0.0),
+                duration=exp.get("duration", 1.0),
+                tags=exp.get("tags") or [],
+                importance=self._calculate_experience_importance(outcome, fitness_change)
+            ))
+        
+        exp_ids = []
+        pending = iter(records)
+        while True:
+            batch = list(islice(pending, batch_size))
+            if not batch:
+                break
+            exp_ids.extend(await self.storage.store_experiences_bulk(batch, sync=sync))
+        
+        if not exp_ids:
+            return []
+        
+        # Only experiences the store accepted update spatial memory and the cache
+        if len(exp_ids) != len(records):
+            stored = set(exp_ids)
+            records = [experience for experience in records if experience.experience_id in stored]
+        
+        # Aggregate visits per location so each spot is updated once
+        locations = {}
+        for experience in records:
+            loc = experience.location
+            key = (loc.get("x", 0.0), loc.get("y", 0.0), loc.get("z", 0.0))
+            entry = locations.setdefault(
+                key, {"location": loc, "visits": 0, "successes": 0, "duration": 0.0}
+            )
+            entry["visits"] += 1
+            entry["duration"] += experience.duration
+            entry["outcome"] = experience.outcome
+            if experience.outcome == "success":
+                entry["successes"] += 1
+        
+        for entry in locations.values():
+            await self._update_spatial_memory(
+                worm_id,
+                entry["location"],
+                entry["outcome"],
+                entry["duration"],
+                visits=entry["visits"],
+                successes=entry["successes"]
+            )
+        
+        episodic_cache = self.memory_cache[MemoryType.EPISODIC]
+        for experience in records:
+            episodic_cache[experience.experience_id] = experience
+        self._stats_cache.pop(worm_id, None)
+        
+        if self.enable_consolidation:
+            await self._check_consolidation_needed(worm_id)
+        
+        logger.info(f"Recorded {len(exp_ids)} experiences for worm {worm_id}")
+        return exp_ids
+    
     def _calculate_experience_importance(self, outcome: str, fitness_change: float) -> float:
         """Calculate importance score for an experience."""
         base_importance = 0.5
@@ -246,9 +383,14 @@ class WormMemoryManager:
         worm_id: str,
         location: Dict[str, float],
         outcome: str,
-        duration: float
+        duration: float,
+        visits: int = 1,
+        successes: Optional[int] = None
     ):
         """Update or create spatial memory for a location."""
+        if successes is None:
+            successes = 1 if outcome == "success" else 0
+        
         # Find existing spatial memory near this location
         nearby_memories = await self.storage.get_spatial_memories_near_location(
             location, radius=20.0, worm_id=worm_id
@@ -257,13 +399,12 @@ class WormMemoryManager:
         if nearby_memories:
             # Update existing spatial memory
             spatial = nearby_memories[0]
-            spatial.visit_count += 1
+            spatial.visit_count += visits
             spatial.last_visited = datetime.now()
             spatial.total_time_spent += duration
             
             # Update success rate
-            if outcome == "success":
-                spatial.food_found_count += 1
+            spatial.food_found_count += successes
             
             # Recalculate success rate
             spatial.success_rate = spatial.food_found_count / spatial.visit_count
@@ -273,13 +414,13 @@ class WormMemoryManager:
         else:
             # Create new spatial memory
             spatial = SpatialMemory(
-                location_id=str(uuid.uuid4()),
+                location_id=_new_memory_id(),
                 worm_id=worm_id,
                 coordinates=location,
                 region_type=self._classify_region_type(outcome),
-                visit_count=1,
-                success_rate=1.0 if outcome == "success" else 0.0,
-                food_found_count=1 if outcome == "success" else 0,
+                visit_count=visits,
+                success_rate=successes / visits,
+                food_found_count=successes,
                 first_visited=datetime.now(),
                 last_visited=datetime.now(),
                 total_time_spent=duration,
@@ -487,7 +628,7 @@ class WormMemoryManager:
             Strategy ID
         """
         strategy = Strategy(
-            strategy_id=str(uuid.uuid4()),
+            strategy_id=_new_memory_id(),
             worm_id=worm_id,
             name=name,
             description=description,
@@ -511,6 +652,7 @@ class WormMemoryManager:
         
         # Cache the strategy
         self.memory_cache[MemoryType.PROCEDURAL][strategy_id] = strategy
+        self._stats_cache.pop(worm_id, None)
         
         logger.info(f"Created strategy {strategy_id}: {name}")
         return strategy_id
@@ -551,8 +693,38 @@ class WormMemoryManager:
         except Exception as e:
             logger.error(f"Memory consolidation failed for worm {worm_id}: {e}")
     
+    def _query_statistics_counts(self, worm_id: str) -> Dict[str, Any]:
+        """Run MEMORY_STATISTICS_AQL and return its single result row."""
+        collections = self.storage.collections
+        
+        # Gather every count in a single round-trip
+        cursor = self.storage.db.aql.execute(
+            MEMORY_STATISTICS_AQL,
+            bind_vars={
+                "@episodic": collections[MemoryType.EPISODIC],
+                "@semantic": collections[MemoryType.SEMANTIC],
+                "@spatial": collections[MemoryType.SPATIAL],
+                "@procedural": collections[MemoryType.PROCEDURAL],
+                "worm_id": worm_id
+            },
+            cache=True,
+            count=False,
+            batch_size=1
+        )
+        try:
+            return next(cursor, None) or {}
+        finally:
+            cursor.close(ignore_missing=True)
+    
     async def get_memory_statistics(self, worm_id: str) -> Dict[str, Any]:
         """Get real memory statistics for a worm from the database."""
+        cached = self._stats_cache.get(worm_id)
+        if cached and time.monotonic() - cached[0] < STATS_CACHE_TTL_SECONDS:
+            # Copy the nested insights list too, so callers never share it
+            stats = dict(cached[1])
+            stats["insights"] = list(stats["insights"])
+            return stats
+        
         stats = {
             "episodic_count": 0,
             "semantic_count": 0,
@@ -572,102 +744,70 @@ class WormMemoryManager:
                 stats["insights"] = ["Memory system not connected"]
                 return stats
             
-            # Simple direct queries for each collection
             try:
-                # Count experiences
-                cursor = self.storage.db.aql.execute(
-                    "FOR doc IN experiences FILTER doc.worm_id == @worm_id COLLECT WITH COUNT INTO length RETURN length",
-                    bind_vars={"worm_id": worm_id}
+                # The driver blocks on I/O, so keep the round-trip off the event loop
+                loop = asyncio.get_running_loop()
+                counts = await loop.run_in_executor(
+                    None, self._query_statistics_counts, worm_id
                 )
-                results = list(cursor)
-                episodic_count = results[0] if results and results[0] else 0
+                
+                episodic_count = counts.get("episodic") or 0
+                spatial_count = counts.get("spatial") or 0
+                procedural_count = counts.get("procedural") or 0
                 stats["episodic_count"] = episodic_count
                 stats["total_experiences"] = episodic_count
-                
-                # Count spatial memories
-                cursor = self.storage.db.aql.execute(
-                    "FOR doc IN spatial_memories FILTER doc.worm_id == @worm_id COLLECT WITH COUNT INTO length RETURN length",
-                    bind_vars={"worm_id": worm_id}
-                )
-                results = list(cursor)
-                stats["spatial_count"] = results[0] if results and results[0] else 0
-                
-                # Count semantic memories  
-                cursor = self.storage.db.aql.execute(
-                    "FOR doc IN knowledge_facts FILTER doc.worm_id == @worm_id COLLECT WITH COUNT INTO length RETURN length",
-                    bind_vars={"worm_id": worm_id}
-                )
-                results = list(cursor)
-                stats["semantic_count"] = results[0] if results and results[0] else 0
-                
-                # Count strategies
-                cursor = self.storage.db.aql.execute(
-                    "FOR doc IN strategies FILTER doc.worm_id == @worm_id COLLECT WITH COUNT INTO length RETURN length",
-                    bind_vars={"worm_id": worm_id}
-                )
-                results = list(cursor)
-                stats["procedural_count"] = results[0] if results and results[0] else 0
+                stats["spatial_count"] = spatial_count
+                stats["semantic_count"] = counts.get("semantic") or 0
+                stats["procedural_count"] = procedural_count
+                stats["locations_visited"] = counts.get("locations") or 0
                 
                 # Calculate success rate from experiences
+                success_rate = 0.0
                 if episodic_count > 0:
-                    cursor = self.storage.db.aql.execute(
-                        "FOR doc IN experiences FILTER doc.worm_id == @worm_id AND doc.outcome == 'success' COLLECT WITH COUNT INTO length RETURN length",
-                        bind_vars={"worm_id": worm_id}
-                    )
-                    results = list(cursor)
-                    success_count = results[0] if results and results[0] else 0
-                    stats["success_rate"] = (success_count / episodic_count) * 100
+                    success_count = counts.get("successes") or 0
+                    success_rate = (success_count / episodic_count) * 100
+                stats["success_rate"] = success_rate
                 
-                # Count unique locations
-                cursor = self.storage.db.aql.execute(
-                    "FOR doc IN spatial_memories FILTER doc.worm_id == @worm_id RETURN DISTINCT doc.location",
-                    bind_vars={"worm_id": worm_id}
+                # Update insights based on data: (condition, message) in display order
+                has_experiences = episodic_count > 0
+                insight_rules = (
+                    (has_experiences, f"Learned from {episodic_count} experiences"),
+                    (has_experiences and success_rate > 70, "High success rate - learning effectively"),
+                    (has_experiences and 40 < success_rate <= 70, "Moderate success - adapting strategies"),
+                    (has_experiences and success_rate <= 40, "Learning from failures - building resilience"),
+                    (not has_experiences, "No experiences recorded yet"),
+                    (spatial_count > 0, f"Remembers {spatial_count} spatial locations"),
+                    (procedural_count > 0, f"Developed {procedural_count} strategies"),
                 )
-                results = list(cursor)
-                stats["locations_visited"] = len(results)
-                
-                # Update insights based on data
-                insights = []
-                if episodic_count > 0:
-                    insights.append(f"Learned from {episodic_count} experiences")
-                    if stats["success_rate"] > 70:
-                        insights.append("High success rate - learning effectively")
-                    elif stats["success_rate"] > 40:
-                        insights.append("Moderate success - adapting strategies")
-                    else:
-                        insights.append("Learning from failures - building resilience")
-                else:
-                    insights.append("No experiences recorded yet")
-                
-                if stats["spatial_count"] > 0:
-                    insights.append(f"Remembers {stats['spatial_count']} spatial locations")
-                
-                if stats["procedural_count"] > 0:
-                    insights.append(f"Developed {stats['procedural_count']} strategies")
+                insights = [message for condition, message in insight_rules if condition]
                 
                 stats["insights"] = insights if insights else ["Memory system active"]
                 
                 # Calculate memory confidence based on data richness
                 confidence = 0.5  # Base confidence
-                if episodic_count > 0:
+                if has_experiences:
                     confidence += min(0.3, episodic_count * 0.05)  # More experiences
-                if stats["success_rate"] > 50:
+                if success_rate > 50:
                     confidence += 0.2  # Good success rate
-                if stats["spatial_count"] > 0:
+                if spatial_count > 0:
                     confidence += 0.1  # Spatial awareness
                 stats["memory_confidence"] = min(1.0, confidence)
                 
-                logger.debug(f"Memory statistics for {worm_id}: {stats}")
+                cached_stats = dict(stats)
+                cached_stats["insights"] = list(stats["insights"])
+                self._stats_cache[worm_id] = (time.monotonic(), cached_stats)
+                logger.debug("Memory statistics for %s: %s", worm_id, stats)
                 
             except Exception as e:
-                logger.error(f"Failed to query memory statistics: {e}")
+                logger.error("Failed to query memory statistics: %s", e)
                 stats["insights"] = [f"Query error: {str(e)[:50]}..."]
                 
         except Exception as e:
-            logger.error(f"Memory statistics failed: {e}")
+            logger.error("Memory statistics failed: %s", e)
             stats["insights"] = ["Memory system error"]
             
         return stats
+    
     def close(self):
         """Close memory manager and cleanup resources."""
         if self.storage:
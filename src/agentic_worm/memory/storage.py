@@ -6,6 +6,7 @@ with support for graph relationships and vector embeddings.
 """
 
 import json
+import re
 import uuid
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
@@ -15,10 +16,12 @@ try:
     from arango import ArangoClient
     from arango.database import StandardDatabase
     from arango.collection import StandardCollection
+    from arango.http import DefaultHTTPClient
     ARANGO_AVAILABLE = True
 except ImportError:
     ARANGO_AVAILABLE = False
     ArangoClient = None
+    DefaultHTTPClient = None
     StandardDatabase = None
     StandardCollection = None
 
@@ -29,6 +32,12 @@ except ImportError:
     EMBEDDINGS_AVAILABLE = False
     SentenceTransformer = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .types import (
     MemoryType, Experience, KnowledgeFact, SpatialMemory, Strategy,
     MemoryQuery, MemoryConsolidationResult
@@ -36,6 +45,96 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# Position of a rejected document in an import_bulk error detail, e.g. "at position 3: ..."
+_IMPORT_ERROR_POSITION = re.compile(r"at position (\d+)")
+
+# Keep-alive connections held per ArangoDB host; covers the executor threads
+# and concurrent writers that share one client
+ARANGO_POOL_SIZE = 32
+
+# Nearby-location lookups used by get_spatial_memories_near_location. The text
+# is fixed and every value is a bind parameter, so ArangoDB can reuse the plan
+_SPATIAL_NEAR_AQL = """
+FOR doc IN @@collection
+    LET distance = SQRT(
+        POW(doc.coordinates.x - @location_obj.x, 2) +
+        POW(doc.coordinates.y - @location_obj.y, 2) +
+        POW(doc.coordinates.z - @location_obj.z, 2)
+    )
+    FILTER distance <= @radius
+    SORT distance ASC
+    RETURN doc
+"""
+_SPATIAL_NEAR_FOR_WORM_AQL = """
+FOR doc IN @@collection
+    FILTER doc.worm_id == @worm_id
+    LET distance = SQRT(
+        POW(doc.coordinates.x - @location_obj.x, 2) +
+        POW(doc.coordinates.y - @location_obj.y, 2) +
+        POW(doc.coordinates.z - @location_obj.z, 2)
+    )
+    FILTER distance <= @radius
+    SORT distance ASC
+    RETURN doc
+"""
+
+# ArangoClient instances shared by every store talking to the same server
+_shared_clients: Dict[str, "ArangoClient"] = {}
+
+# Number of stores currently holding each shared client
+_client_refs: Dict[str, int] = {}
+
+
+def _orjson_serialize(document: Any) -> str:
+    """Encode a request body for ArangoDB with orjson, falling back to json."""
+    try:
+        return orjson.dumps(document, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    except TypeError:
+        # orjson rejects some inputs json accepts (e.g. non-str keys)
+        return json.dumps(document)
+
+
+def get_arango_client(hosts: str) -> "ArangoClient":
+    """
+    Get a process-wide ArangoClient for ``hosts``, creating it on first use.
+    
+    Each call takes a reference; pair it with ``release_arango_client``.
+    """
+    client = _shared_clients.get(hosts)
+    if client is None:
+        http_client = DefaultHTTPClient(
+            request_timeout=30,
+            pool_connections=ARANGO_POOL_SIZE,
+            pool_maxsize=ARANGO_POOL_SIZE
+        )
+        codec = {}
+        if ORJSON_AVAILABLE:
+            codec = {"serializer": _orjson_serialize, "deserializer": orjson.loads}
+        client = ArangoClient(hosts=hosts, http_client=http_client, **codec)
+        _shared_clients[hosts] = client
+    _client_refs[hosts] = _client_refs.get(hosts, 0) + 1
+    return client
+
+
+def release_arango_client(hosts: str):
+    """Drop a reference taken by ``get_arango_client``, closing the client once unused."""
+    refs = _client_refs.get(hosts, 0) - 1
+    if refs > 0:
+        _client_refs[hosts] = refs
+        return
+    _client_refs.pop(hosts, None)
+    client = _shared_clients.pop(hosts, None)
+    if client is not None:
+        client.close()
+
+
+def close_arango_clients():
+    """Close all shared ArangoClient instances (e.g. at process shutdown)."""
+    for client in _shared_clients.values():
+        client.close()
+    _shared_clients.clear()
+    _client_refs.clear()
+
 
 class ArangoMemoryStore:
     """
@@ -79,6 +178,7 @@ class ArangoMemoryStore:
         logger.info(f"🔗 ArangoDB Storage Config: {host}:{port}/{database_name} ({auth_info})")
         
         self.client = None
+        self._client_hosts = f"http://{host}:{port}"
         self.db = None
         self.embeddings = None
         
@@ -122,11 +222,9 @@ class ArangoMemoryStore:
             try:
                 logger.info(f"Attempting to connect to ArangoDB at {self.host}:{self.port} (attempt {attempt + 1}/{max_retries})")
                 
-                # Create client with longer timeout
-                self.client = ArangoClient(
-                    hosts=f"http://{self.host}:{self.port}",
-                    request_timeout=30
-                )
+                # Reuse the shared client (and its HTTP connection pool)
+                if self.client is None:
+                    self.client = get_arango_client(self._client_hosts)
                 
                 # Test connection first (handle no-auth ArangoDB)
                 if self.username and self.password:
@@ -210,11 +308,13 @@ class ArangoMemoryStore:
     def _create_indexes(self, collection: StandardCollection, memory_type: MemoryType):
         """Create appropriate indexes for each memory type."""
         try:
-            # Common indexes
-            collection.add_hash_index(fields=["worm_id"])
+            # Common indexes; every per-worm query filters on worm_id first, and
+            # the (worm_id, timestamp) prefix also serves worm_id-only lookups
+            collection.add_persistent_index(fields=["worm_id", "timestamp"])
             collection.add_skiplist_index(fields=["timestamp"])
             
             if memory_type == MemoryType.EPISODIC:
+                collection.add_persistent_index(fields=["worm_id", "outcome"])
                 collection.add_skiplist_index(fields=["outcome"])
                 collection.add_skiplist_index(fields=["goal"])
                 collection.add_geo_index(fields=["location"])
@@ -247,31 +347,25 @@ class ArangoMemoryStore:
             logger.error(f"Failed to generate embedding: {e}")
             return None
     
-    async def store_experience(self, experience: Experience) -> str:
-        """Store episodic memory (experience)."""
+    async def store_experience(self, experience: Experience, sync: Optional[bool] = None) -> str:
+        """
+        Store episodic memory (experience).
+        
+        Args:
+            experience: Experience to store
+            sync: Wait for the write to be synced to disk; None uses the
+                collection default
+        """
         if not self.db:
             logger.error("Database not initialized")
             return ""
         
         try:
-            # Generate embedding
-            exp_text = f"{experience.goal} {experience.outcome} {' '.join(experience.tags)}"
-            embedding = self._generate_embedding(exp_text)
-            
-            # Prepare document - convert to dict first
-            doc = experience.dict()
-            
-            # Serialize datetime objects to ISO format strings
-            doc = self._serialize_datetime_fields(doc)
-            
-            doc["_key"] = experience.experience_id
-            doc["memory_type"] = MemoryType.EPISODIC.value
-            doc["embedding"] = embedding
-            doc["created_at"] = datetime.now().isoformat()
+            doc = self._prepare_experience_doc(experience)
             
             # Store in database
             collection = self.db.collection(self.collections[MemoryType.EPISODIC])
-            result = collection.insert(doc, overwrite=True)
+            result = collection.insert(doc, overwrite=True, sync=sync)
             
             logger.info(f"Stored experience: {experience.experience_id}")
             return result["_key"]
@@ -280,6 +374,80 @@ class ArangoMemoryStore:
             logger.error(f"Failed to store experience: {e}")
             return ""
     
+    async def store_experiences_bulk(
+        self,
+        experiences: List[Experience],
+        sync: bool = False
+    ) -> List[str]:
+        """
+        Store many experiences with a single bulk-import request.
+        
+        Documents that fail to import are skipped rather than aborting
+        the whole batch.
+        
+        Args:
+            experiences: Experiences to insert
+            sync: Wait for the batch to be synced to disk
+            
+        Returns:
+            Keys of the stored experiences
+        """
+        if not self.db:
+            logger.error("Database not initialized")
+            return []
+        
+        if not experiences:
+            return []
+        
+        try:
+            docs = [self._prepare_experience_doc(experience) for experience in experiences]
+            
+            collection = self.db.collection(self.collections[MemoryType.EPISODIC])
+            result = collection.import_bulk(
+                docs,
+                on_duplicate="replace",
+                sync=sync,
+                halt_on_error=False,
+                details=True
+            )
+            
+            # Drop the keys of any documents the server rejected
+            failed = {
+                int(match.group(1))
+                for detail in result.get("details", [])
+                for match in [_IMPORT_ERROR_POSITION.search(detail)]
+                if match
+            }
+            if result.get("errors"):
+                logger.warning(f"{result['errors']} experiences were rejected by bulk import")
+            keys = [doc["_key"] for i, doc in enumerate(docs) if i not in failed]
+            
+            logger.info(f"Stored {len(keys)} experiences in bulk")
+            return keys
+            
+        except Exception as e:
+            logger.error(f"Failed to bulk store experiences: {e}")
+            return []
+    
+    def _prepare_experience_doc(self, experience: Experience) -> Dict[str, Any]:
+        """Build the ArangoDB document for an experience."""
+        # Generate embedding
+        exp_text = f"{experience.goal} {experience.outcome} {' '.join(experience.tags)}"
+        embedding = self._generate_embedding(exp_text)
+        
+        # Prepare document - convert to dict first
+        doc = experience.dict()
+        
+        # Serialize datetime objects to ISO format strings
+        doc = self._serialize_datetime_fields(doc)
+        
+        doc["_key"] = experience.experience_id
+        doc["memory_type"] = MemoryType.EPISODIC.value
+        doc["embedding"] = embedding
+        doc["created_at"] = datetime.now().isoformat()
+        
+        return doc
+    
     async def store_knowledge_fact(self, fact: KnowledgeFact) -> str:
         """Store semantic memory (knowledge fact)."""
         if not self.db:
@@ -507,14 +675,7 @@ class ArangoMemoryStore:
         try:
             collection = self.db.collection(self.collections[MemoryType.SPATIAL])
             
-            # Build query for nearby locations using Euclidean distance
-            distance_calc = self._calculate_distance_aql("doc.coordinates", "@location_obj")
-            
-            aql_query = f"""
-            FOR doc IN @@collection
-            FILTER {distance_calc} <= @radius
-            """
-            
+            aql_query = _SPATIAL_NEAR_AQL
             bind_vars = {
                 "@collection": collection.name,
                 "location_obj": {
@@ -526,17 +687,14 @@ class ArangoMemoryStore:
             }
             
             if worm_id:
-                aql_query += " AND doc.worm_id == @worm_id"
+                aql_query = _SPATIAL_NEAR_FOR_WORM_AQL
                 bind_vars["worm_id"] = worm_id
             
-            aql_query += f" SORT {distance_calc} ASC RETURN doc"
+            cursor = self.db.aql.execute(aql_query, bind_vars=bind_vars, cache=True)
             
-            cursor = self.db.aql.execute(aql_query, bind_vars=bind_vars)
-            results = list(cursor)
-            
-            # Convert to SpatialMemory objects
+            # Convert to SpatialMemory objects as batches arrive
             spatial_memories = []
-            for result in results:
+            for result in cursor:
                 try:
                     spatial_memory = SpatialMemory(**result)
                     spatial_memories.append(spatial_memory)
@@ -663,10 +821,16 @@ class ArangoMemoryStore:
         return []
     
     def close(self):
-        """Close database connection."""
+        """Release database connection.
+        
+        The underlying client is shared with other stores; its connection
+        pool is closed once the last store using it releases it.
+        """
         if self.client:
-            self.client.close()
-            logger.info("Closed ArangoDB connection") 
+            release_arango_client(self._client_hosts)
+            self.client = None
+            self.db = None
+            logger.info("Released ArangoDB connection")
 
     def _serialize_datetime_fields(self, doc: dict) -> dict:
         """Convert datetime objects to ISO format strings for JSON serialization."""
@@ -7,6 +7,7 @@ decision-making process, neural activity, and worm behavior in real-time.
 
 import asyncio
 import json
+from collections import deque
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
@@ -21,12 +22,44 @@ try:
 except ImportError:
     FASTAPI_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..core.state import WormState
 from ..core.system import AgenticWormSystem
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(payload: Dict[str, Any]) -> str:
+    """Encode a WebSocket payload as JSON text, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        except TypeError:
+            pass  # orjson rejects some inputs json accepts (e.g. non-str keys)
+    return json.dumps(payload, separators=(",", ":"))
+
+
+# Number of clients written to before yielding back to the event loop
+_CLIENTS_PER_YIELD = 50
+
+# Placeholder memory statistics sent before the memory system reports in
+DEFAULT_MEMORY_STATS = {
+    "episodic_count": 0,
+    "spatial_count": 0,
+    "semantic_count": 0,
+    "strategies_count": 0,
+    "memory_confidence": 0.5,
+    "success_rate": 0.0,
+    "locations_visited": 0,
+    "insights": ["memory_system_initializing"]
+}
+
+
 class DashboardServer:
     """
     Real-time dashboard server for visualizing agentic worm behavior.
@@ -54,6 +87,13 @@ class DashboardServer:
         self.active_connections: List[WebSocket] = []
         self.is_running = False
         
+        # Coalesced updates, flushed as one frame every broadcast_interval;
+        # the oldest snapshots are dropped if more than a batch piles up
+        self.broadcast_batch_size = 50
+        self.broadcast_interval = 0.1
+        self._pending_updates: deque = deque(maxlen=self.broadcast_batch_size)
+        self._flush_task: Optional[asyncio.Task] = None
+        
         if not FASTAPI_AVAILABLE:
             logger.warning("⚠️ FastAPI not available - dashboard will use console mode")
             self.console_mode = True
@@ -102,11 +142,11 @@ class DashboardServer:
                 # Send real-time state updates
                 if self.worm_system and self.worm_system.current_state:
                     state_data = self._serialize_state(self.worm_system.current_state)
-                    await websocket.send_json({
+                    await websocket.send_text(_dumps({
                         "type": "state_update",
                         "data": state_data,
                         "timestamp": datetime.now().isoformat()
-                    })
+                    }))
                 
                 await asyncio.sleep(0.1)  # 10 FPS update rate
                 
@@ -207,6 +247,9 @@ class DashboardServer:
     async def stop_server(self) -> None:
         """Stop the dashboard server."""
         self.is_running = False
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._pending_updates.clear()
         logger.info("🛑 Dashboard server stopped")
     
     async def _console_dashboard(self) -> None:
@@ -237,21 +280,58 @@ class DashboardServer:
             logger.info("\n🛑 Console dashboard stopped by user")
             self.is_running = False
     
+    def queue_update(self, data: Dict[str, Any]) -> None:
+        """
+        Queue an update for the next batched broadcast.
+        
+        Producers such as the per-step visualizer call this instead of
+        awaiting ``_broadcast_update``; queued updates are sent together
+        as a single ``batch`` frame every ``broadcast_interval`` seconds.
+        
+        Args:
+            data: Update message to deliver to every connected client
+        """
+        if not self.active_connections:
+            return
+        
+        self._pending_updates.append(data)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_updates())
+    
+    async def _flush_updates(self) -> None:
+        """Send queued updates in batches until the queue is empty."""
+        while self._pending_updates:
+            await asyncio.sleep(self.broadcast_interval)
+            
+            updates = list(self._pending_updates)
+            self._pending_updates.clear()
+            if len(updates) == 1:
+                await self._broadcast_update(updates[0])
+            elif updates:
+                await self._broadcast_update({"type": "batch", "updates": updates})
+    
     async def _broadcast_update(self, data: Dict[str, Any]) -> None:
         """Broadcast update to all connected WebSocket clients."""
         if not self.active_connections:
             return
         
+        # Encode once and share the text frame across every client
+        message = _dumps(data)
         disconnected = []
-        for connection in self.active_connections:
+        for count, connection in enumerate(list(self.active_connections), 1):
             try:
-                await connection.send_json(data)
+                await connection.send_text(message)
             except Exception:
                 disconnected.append(connection)
+            
+            # Let other tasks run between groups of clients
+            if count % _CLIENTS_PER_YIELD == 0:
+                await asyncio.sleep(0)
         
         # Remove disconnected clients
         for connection in disconnected:
-            self.active_connections.remove(connection)
+            if connection in self.active_connections:
+                self.active_connections.remove(connection)
     
     def _serialize_state(self, state: WormState) -> Dict[str, Any]:
         """Serialize worm state for JSON transmission."""
@@ -286,16 +366,7 @@ class DashboardServer:
                 "recent_rewards": state["learning_state"]["recent_rewards"][-10:],  # Last 10 rewards
                 "behavior_success_rates": state["learning_state"]["behavior_success_rates"]
             },
-            "memory_stats": state.get("memory_stats", {
-                "episodic_count": 0,
-                "spatial_count": 0,
-                "semantic_count": 0,
-                "strategies_count": 0,
-                "memory_confidence": 0.5,
-                "success_rate": 0.0,
-                "locations_visited": 0,
-                "insights": ["memory_system_initializing"]
-            })
+            "memory_stats": state.get("memory_stats", DEFAULT_MEMORY_STATS)
         }
     
     def _generate_dashboard_html(self) -> str:
@@ -845,7 +916,9 @@ class DashboardServer:
 
         // Handle real-time updates
         function handleRealtimeUpdate(data) {
-            if (data.type === 'state_update') {
+            if (data.type === 'batch') {
+                data.updates.forEach(handleRealtimeUpdate);
+            } else if (data.type === 'state_update') {
                 updateDashboard(data.data);
             } else if (data.type === 'goal_changed') {
                 logActivity(`🎯 Goal changed to: ${data.goal}`);
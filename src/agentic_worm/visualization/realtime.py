@@ -242,15 +242,20 @@ class RealtimeVisualizer:
     
     async def _update_dashboard(self, viz_data: Dict[str, Any]) -> None:
         """Update dashboard with visualization data."""
-        if not self.dashboard_server or not hasattr(self.dashboard_server, '_broadcast_update'):
+        if not self.dashboard_server:
             return
         
+        update = {
+            "type": "visualization_update",
+            "data": viz_data
+        }
+        
         try:
-            # Send update to dashboard
-            await self.dashboard_server._broadcast_update({
-                "type": "visualization_update",
-                "data": viz_data
-            })
+            # Queue for the dashboard's batched broadcast rather than writing every client per step
+            if hasattr(self.dashboard_server, 'queue_update'):
+                self.dashboard_server.queue_update(update)
+            elif hasattr(self.dashboard_server, '_broadcast_update'):
+                await self.dashboard_server._broadcast_update(update)
         except Exception as e:
             logger.error(f"⚠️ Dashboard update failed: {e}")
     